@@ -5,106 +5,62 @@ Key findings:
 - Page is an SPA that loads content via JavaScript
 - Content lives inside .body_content / #body-content element
 - Headless mode may trigger anti-bot detection, headed mode works
-- Need to wait 5+ seconds for JavaScript to fully render
+- Need to wait for JavaScript to fill in .body_content before reading the page
 """
 
 import asyncio
-from bs4 import BeautifulSoup
-from playwright.async_api import async_playwright
+import orjson
+from playwright.async_api import async_playwright, Page
 
+from scraper.extract import extract_content
+from scraper.scraper import block_heavy_resources, wait_for_content
 
-async def scrape_single_page(url: str, headless: bool = False):
+
+async def scrape_single_page(url: str, headless: bool = False, page: Page | None = None):
     """
     Scrape a single Autodesk help page.
     
     Args:
         url: The URL to scrape
         headless: If False, opens browser window (more reliable but visible)
+        page: Existing page to reuse when scraping several URLs; if omitted,
+              a browser is launched (and closed) for this call
     """
+    if page is not None:
+        return await _load_page_html(page, url)
+    
     async with async_playwright() as p:
         # IMPORTANT: headless=False seems to avoid anti-bot detection
         browser = await p.chromium.launch(headless=headless)
-        page = await browser.new_page()
-        
-        print(f"Navigating to: {url}")
-        await page.goto(url, wait_until="networkidle")
-        
-        # Wait extra time for JavaScript to fully render the content
-        print("Waiting for JavaScript to render content...")
-        await asyncio.sleep(5)
-        
-        # Check if we got the real content or "Page Not Found"
-        title = await page.title()
-        print(f"Page title: {title}")
+        context = await browser.new_context()
+        await block_heavy_resources(context)
+        page = await context.new_page()
         
-        if "Page Not Found" in title:
-            print("⚠️  WARNING: Got 'Page Not Found' - try running with headless=False")
-        
-        # Get the HTML content of the page
-        html = await page.content()
-        
-        await browser.close()
-        
-        return html
+        try:
+            return await _load_page_html(page, url)
+        finally:
+            await browser.close()
 
 
-def extract_content(html: str) -> dict:
-    """
-    Extract structured content from Autodesk help page HTML.
+async def _load_page_html(page: Page, url: str) -> str:
+    """Navigate to a help page and return its HTML once the content rendered."""
+    print(f"Navigating to: {url}")
+    await page.goto(url, wait_until="domcontentloaded")
     
-    The key selector is .body_content which contains the main documentation.
-    """
-    soup = BeautifulSoup(html, "lxml")
-    
-    # The main content is in .body_content (discovered via debug)
-    main_content = (
-        soup.select_one(".body_content") or
-        soup.select_one("#body-content") or
-        soup.select_one(".caas_body") or
-        soup.select_one("article") or
-        soup.body
-    )
-    
-    if not main_content:
-        return {"error": "Could not find main content"}
-    
-    # Remove unnecessary elements
-    for tag in main_content.select("script, style, noscript, .related-links"):
-        tag.decompose()
-
-    # Extract the page title (h1)
-    h1 = main_content.select_one("h1")
-    title = h1.get_text(strip=True) if h1 else ""
+    # Wait for JavaScript to render the content
+    print("Waiting for JavaScript to render content...")
+    if not await wait_for_content(page):
+        print("⚠️  WARNING: Content did not render in time")
     
-    # Extract headings (h2, h3, h4, etc.)
-    headings = [h.get_text(strip=True) for h in main_content.find_all(["h2", "h3", "h4", "h5", "h6"])]
+    # Check if we got the real content or "Page Not Found"
+    title = await page.title()
+    print(f"Page title: {title}")
     
-    # Extract paragraphs
-    paragraphs = [p.get_text(strip=True) for p in main_content.find_all("p")]
+    if "Page Not Found" in title:
+        print("⚠️  WARNING: Got 'Page Not Found' - try running with headless=False")
     
-    # Extract code blocks
-    code_blocks = [code.get_text(strip=True) for code in main_content.find_all("pre")]
-
-    # Extract the full text content (useful for search indexing)
-    full_text = main_content.get_text(separator="\n", strip=True)
-
-    # Extract tables (optional, if relevant)
-    tables = []
-    for table in main_content.find_all("table"):
-        rows = []
-        for tr in table.find_all("tr"):
-            cells = [td.get_text(strip=True) for td in tr.find_all(["th", "td"])]
-            rows.append(cells)
-        tables.append(rows)
-
-    return {
-        "title": title,
-        "headings": headings,
-        "paragraphs": paragraphs,
-        "code_blocks": code_blocks,
-        "tables": tables,
-        "full_text": full_text,
-    }
+    # Get the HTML content of the page
+    return await page.content()
 
 
 if __name__ == "__main__":
@@ -137,9 +93,8 @@ if __name__ == "__main__":
     print(f"📊 Tables: {len(extracted.get('tables', []))}")
     
     # Save to file
-    import json
-    with open("extracted_content.json", "w", encoding="utf-8") as f:
-        json.dump(extracted, f, ensure_ascii=False, indent=4)
+    with open("extracted_content.json", "wb") as f:
+        f.write(orjson.dumps(extracted, option=orjson.OPT_INDENT_2))
     
     print(f"\n✅ Content saved to extracted_content.json")
     print(f"   Full text length: {len(extracted.get('full_text', ''))} characters")
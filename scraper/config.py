@@ -41,10 +41,20 @@ SELECTORS = {
     "expand_button": "[class*='expand'], [class*='toggle'], .tree-toggle",
 }
 
+# Element holding the rendered documentation (the SPA fills it in via JS)
+CONTENT_SELECTOR = ".body_content, #body-content"
+
+# Resource types the text extraction never needs; aborted to speed up loads
+BLOCKED_RESOURCE_TYPES = {"image", "media", "font", "stylesheet"}
+
 # Output configuration
 OUTPUT_DIR = "data/docs"
+PAGES_FILE = "pages.jsonl.gz"  # append-only, one scraped page per line
 OUTPUT_FORMAT = "json"  # json or markdown
 
 # Scraping settings
 PAGE_LOAD_TIMEOUT = 30000  # milliseconds
+CONTENT_TIMEOUT = 10000  # milliseconds to wait for the content to render
 NAVIGATION_DELAY = 1000  # milliseconds between page loads (be nice to server)
+CONCURRENCY = 4  # browser contexts scraping pages in parallel
+CACHE_MAX_AGE_DAYS = 7  # reuse pages scraped more recently than this
@@ -0,0 +1,152 @@
+"""
+HTML content extraction for Autodesk Alias help pages.
+
+Parsing and traversal run entirely in lxml, so the functions here are
+CPU-bound and safe to call from a worker thread.
+"""
+
+import re
+
+import lxml.html
+from lxml import etree
+
+
+def _has_class(name: str) -> str:
+    """XPath predicate matching elements whose class list contains ``name``."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+# Shared parser: comments and processing instructions are dropped by libxml2
+# while the tree is built, so they never reach the extraction pass.
+HTML_PARSER = lxml.html.HTMLParser(remove_comments=True, remove_pis=True, no_network=True)
+
+# Main content candidates, in priority order. The docs live in .body_content
+# (discovered via debug); the others are fallbacks.
+MAIN_CONTENT_XPATHS = [
+    etree.XPath(f".//*[{_has_class('body_content')}]"),
+    etree.XPath(".//*[@id='body-content']"),
+    etree.XPath(f".//*[{_has_class('caas_body')}]"),
+    etree.XPath(".//article"),
+    etree.XPath(".//main"),
+    etree.XPath(".//body"),
+]
+
+# Site chrome removed when falling back to the whole <body>
+PAGE_CHROME = etree.XPath(
+    ".//nav|.//header|.//footer"
+    f"|.//*[{_has_class('toc')} or {_has_class('sidebar')} or {_has_class('navigation')}]"
+)
+
+RELATED_LINKS = etree.XPath(f".//*[{_has_class('related-links')}]")
+
+# Opening tag of the .body_content div, and any div open/close tag after it
+_RE_BODY_CONTENT_OPEN = re.compile(r'<div\b[^>]*\bclass="[^"]*\bbody_content\b', re.IGNORECASE)
+_RE_DIV_TAG = re.compile(r'<(/?)div\b', re.IGNORECASE)
+
+# Every tag we bucket, collected in one walk over the content subtree
+EXTRACT_TAGS = ("h1", "h2", "h3", "h4", "h5", "h6", "p", "pre", "table")
+
+
+def _text(el) -> str:
+    """Concatenate the stripped text nodes of an element (like BS4's ``get_text(strip=True)``)."""
+    if len(el):
+        return "".join(map(str.strip, el.itertext()))
+    # Leaf element (most headings and many paragraphs): its only text node
+    return (el.text or "").strip()
+
+
+def slice_body(html: str) -> str:
+    """
+    Cut the .body_content div out of a page before it is parsed.
+    
+    The help pages are mostly navigation, scripts and footer; the machine-
+    generated markup is well-formed, so counting ``<div``/``</div>`` tags from
+    the opening tag finds the matching close without parsing anything else.
+    Returns the whole page when the div is missing or never closes.
+    """
+    match = _RE_BODY_CONTENT_OPEN.search(html)
+    if match is None:
+        return html
+    
+    depth = 0
+    for tag in _RE_DIV_TAG.finditer(html, match.start()):
+        depth += -1 if tag.group(1) else 1
+        if depth == 0:
+            end = html.find(">", tag.end())
+            if end < 0:
+                break
+            return html[match.start():end + 1]
+    return html
+
+
+def extract_content(html: str, require_body_content: bool = False) -> dict:
+    """
+    Extract structured content from Autodesk help page HTML.
+    
+    The key selector is .body_content which contains the main documentation;
+    it is sliced out of the raw HTML first so the rest of the page is never parsed.
+    Parsing and traversal happen in lxml: a single ``iter()`` walk yields every
+    heading, paragraph, code block and table, dispatched on the tag name.
+    With ``require_body_content`` the fallback selectors are skipped, so HTML
+    without the .body_content div (an error or login page) yields an error.
+    """
+    try:
+        root = lxml.html.document_fromstring(slice_body(html), parser=HTML_PARSER)
+    except etree.ParserError:
+        return {"error": "Could not find main content"}
+    
+    main_content = None
+    for xpath in MAIN_CONTENT_XPATHS[:1] if require_body_content else MAIN_CONTENT_XPATHS:
+        matches = xpath(root)
+        if matches:
+            main_content = matches[0]
+            break
+    
+    if main_content is None:
+        return {"error": "Could not find main content"}
+    
+    # Remove unnecessary elements (tail text is kept, as with BS4's decompose)
+    etree.strip_elements(main_content, "script", "style", "noscript", with_tail=False)
+    for tag in RELATED_LINKS(main_content):
+        tag.drop_tree()
+    if main_content.tag == "body":
+        for tag in PAGE_CHROME(main_content):
+            tag.drop_tree()
+
+    title = None
+    headings = []
+    paragraphs = []
+    code_blocks = []
+    tables = []
+
+    buckets = {
+        "h2": headings, "h3": headings, "h4": headings, "h5": headings, "h6": headings,
+        "p": paragraphs,
+        "pre": code_blocks,
+    }
+
+    for el in main_content.iter(EXTRACT_TAGS):
+        tag = el.tag
+        bucket = buckets.get(tag)
+        if bucket is not None:
+            bucket.append(_text(el))
+        elif tag == "h1":
+            # The page title is the first h1
+            if title is None:
+                title = _text(el)
+        else:
+            tables.append([[_text(cell) for cell in tr.iter("th", "td")] for tr in el.iter("tr")])
+
+    # Extract the full text content (useful for search indexing). This is a
+    # separate itertext() walk on purpose: lists, notes and bare div text are
+    # not in any bucket above but must still be searchable.
+    full_text = "\n".join(filter(None, map(str.strip, main_content.itertext())))
+
+    return {
+        "title": title or "",
+        "headings": headings,
+        "paragraphs": paragraphs,
+        "code_blocks": code_blocks,
+        "tables": tables,
+        "full_text": full_text,
+    }
@@ -6,20 +6,132 @@ and extract documentation content for the MCP server.
 """
 
 import asyncio
-import json
+import gzip
+import multiprocessing
 import re
 import os
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from datetime import datetime
-from playwright.async_api import async_playwright, Page, Browser
+from datetime import datetime, timedelta, timezone
+
+import orjson
+from playwright.async_api import async_playwright, Page, Browser, BrowserContext, Route
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
 from .config import (
     BASE_URL,
     API_SECTION_GUID,
     OUTPUT_DIR,
+    PAGES_FILE,
     PAGE_LOAD_TIMEOUT,
     NAVIGATION_DELAY,
+    CONCURRENCY,
+    CACHE_MAX_AGE_DAYS,
+    CONTENT_SELECTOR,
+    CONTENT_TIMEOUT,
+    BLOCKED_RESOURCE_TYPES,
 )
+from .extract import extract_content
+
+
+GUID_PLACEHOLDER = "{guid}"
+
+# Compiled once at import; these run for every page
+_RE_NEWLINES = re.compile(r'\n{3,}')
+_RE_SPACES = re.compile(r' {2,}')
+# Also used as a JavaScript RegExp source in _COLLECT_LINKS_JS
+_RE_GUID = re.compile(r'guid=(GUID-[A-F0-9a-f-]+)')
+
+# Expands every collapsed node under a root (or the whole document) inside the
+# page, so the whole tree costs one round-trip instead of one per click. Each
+# round clicks all newly found collapsed toggles, then waits for their
+# children to load before looking again.
+_EXPAND_TREE_JS = """
+async ([root, maxRounds, settleMs]) => {
+    const selector = 'li.node-tree-item[aria-expanded="false"] > span.expand-collapse';
+    const scope = root || document;
+    const clicked = new Set();
+    let total = 0;
+    for (let round = 0; round < maxRounds; round++) {
+        const buttons = Array.from(scope.querySelectorAll(selector)).filter(b => !clicked.has(b));
+        if (!buttons.length) break;
+        for (const button of buttons) {
+            clicked.add(button);
+            button.click();
+        }
+        total += buttons.length;
+        await new Promise(resolve => setTimeout(resolve, settleMs));
+    }
+    return total;
+}
+"""
+
+# Returns {href, title, guid} for every titled GUID link under a root (or the
+# whole document) in a single evaluation instead of two round-trips per link.
+# GUIDs already in `seen`, or seen earlier in the tree, are skipped in-page.
+_COLLECT_LINKS_JS = """
+({root, guidPattern, seen}) => {
+    const guidRe = new RegExp(guidPattern);
+    const visited = new Set(seen);
+    const links = [];
+    for (const a of (root || document).querySelectorAll('a[href*="guid=GUID"]')) {
+        const title = (a.innerText || '').trim();
+        const href = a.getAttribute('href') || '';
+        const match = guidRe.exec(href);
+        if (!title || !match || visited.has(match[1])) continue;
+        visited.add(match[1]);
+        links.push({href, title, guid: match[1]});
+    }
+    return links;
+}
+"""
+
+
+def _clean_text(text: str) -> str:
+    """Collapse runs of blank lines and repeated spaces in extracted text."""
+    text = _RE_NEWLINES.sub('\n\n', text)
+    text = _RE_SPACES.sub(' ', text)
+    return text.strip()
+
+
+async def wait_for_content(page: Page, timeout: int = CONTENT_TIMEOUT) -> bool:
+    """
+    Wait until the SPA has rendered the documentation content.
+
+    Returns as soon as the content element holds meaningful text instead of
+    sleeping a fixed time or waiting for the network to go idle (analytics
+    and chat widgets keep it busy long after the docs are on screen).
+    Returns False if that doesn't happen within ``timeout`` (e.g. a
+    'Page Not Found' page); callers extract what is there.
+    """
+    try:
+        await page.wait_for_selector(CONTENT_SELECTOR, timeout=timeout)
+        await page.wait_for_function(
+            "(selector) => (document.querySelector(selector)?.innerText || '').trim().length > 100",
+            arg=CONTENT_SELECTOR,
+            timeout=timeout,
+        )
+        return True
+    except PlaywrightTimeoutError:
+        return False
+
+
+async def _abort_heavy_resources(route: Route):
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def block_heavy_resources(context: BrowserContext):
+    """
+    Abort image, media, font and stylesheet requests in a browser context.
+
+    Only the DOM text is extracted, and these subresources are most of what
+    a help page loads.
+    """
+    await context.route("**/*", _abort_heavy_resources)
 
 
 class AutodeskDocsScraper:
@@ -28,10 +140,27 @@ class AutodeskDocsScraper:
     def __init__(self, output_dir: str = OUTPUT_DIR):
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.pages_path = self.output_dir / PAGES_FILE
         self.scraped_pages: list[dict] = []
         self.visited_guids: set[str] = set()
+        # Pages saved by previous runs (keyed by GUID), and how many of them
+        # this run re-scraped and so superseded in the pages file
+        self.saved_pages: dict[str, dict] = {}
+        self.superseded = 0
+        self.pages_truncated = False
+        self._pages_file = None
+        self._parse_pool: ProcessPoolExecutor | None = None
+        # Pages are stamped with the run's start time plus a monotonic offset
+        self.run_started_at = datetime.now(timezone.utc).isoformat()
+        self._run_t0 = time.monotonic()
+        # URL pattern of the request that delivers a page's HTML, with the
+        # GUID replaced by GUID_PLACEHOLDER (sniffed from a render, and only
+        # trusted once a direct fetch reproduces that page's rendered content)
+        self.fragment_url: str | None = None
+        self.fragment_blocked = False
+        self._rejected_fragment_urls: set[str] = set()
 
-    async def run(self, test_mode: bool = False, headless: bool = False):
+    async def run(self, test_mode: bool = False, headless: bool = False, refresh: bool = False):
         """
         Main entry point to run the scraper.
         
@@ -39,14 +168,20 @@ class AutodeskDocsScraper:
             test_mode: If True, only scrape a few pages for testing.
             headless: If False (default), runs browser in headed mode.
                       Headed mode is more reliable as it avoids anti-bot detection.
+            refresh: If True, re-scrape every page even if a recent copy exists.
         """
         print("Starting Autodesk Alias documentation scraper...")
         print(f"Running in {'headless' if headless else 'headed'} mode")
         
+        self.saved_pages = self._load_saved_pages()
+        self.run_started_at = datetime.now(timezone.utc).isoformat()
+        self._run_t0 = time.monotonic()
+        
         async with async_playwright() as p:
             # IMPORTANT: headless=False avoids anti-bot detection on Autodesk help site
             browser = await p.chromium.launch(headless=headless)
             context = await browser.new_context()
+            await block_heavy_resources(context)
             page = await context.new_page()
             page.set_default_timeout(PAGE_LOAD_TIMEOUT)
             
@@ -54,9 +189,8 @@ class AutodeskDocsScraper:
                 # Navigate to the API section
                 start_url = f"{BASE_URL}?guid={API_SECTION_GUID}"
                 print(f"Navigating to: {start_url}")
-                await page.goto(start_url)
-                await page.wait_for_load_state("networkidle")
-                await asyncio.sleep(5)  # Wait for JS to render (5s needed for SPA content)
+                await page.goto(start_url, wait_until="domcontentloaded")
+                await wait_for_content(page)  # Wait for JS to render the SPA content
                 
                 # Expand the API section in navigation and discover all pages
                 page_links = await self._discover_api_pages(page)
@@ -66,13 +200,26 @@ class AutodeskDocsScraper:
                     page_links = page_links[:5]  # Only scrape 5 pages in test mode
                     print(f"Test mode: limiting to {len(page_links)} pages")
                 
-                # Scrape each page
-                for i, link in enumerate(page_links):
-                    print(f"Scraping page {i+1}/{len(page_links)}: {link.get('title', 'Unknown')}")
-                    await self._scrape_page(page, link)
-                    await asyncio.sleep(NAVIGATION_DELAY / 1000)  # Be nice to server
+                if not refresh:
+                    page_links = self._reuse_cached_pages(page_links)
+                
+                # Scrape the pages across a pool of browser contexts; each
+                # page is appended to the pages file as soon as it's scraped
+                # (each run adds a new gzip member, read back as one stream).
+                # Parse workers are spawned rather than forked: a fork here
+                # would copy the running event loop, Playwright's driver pipes
+                # and the open pages file into every child.
+                with (
+                    gzip.open(self.pages_path, 'ab', compresslevel=6) as self._pages_file,
+                    ProcessPoolExecutor(
+                        max_workers=min(CONCURRENCY, os.cpu_count() or 1),
+                        mp_context=multiprocessing.get_context("spawn"),
+                    ) as self._parse_pool,
+                ):
+                    await self._scrape_all(browser, page_links)
+                self._parse_pool = None
                 
-                # Save all scraped content
+                # Save the index (and drop superseded records)
                 self._save_results()
                 print(f"Scraping complete! Saved {len(self.scraped_pages)} pages to {self.output_dir}")
                 
@@ -127,44 +274,35 @@ class AutodeskDocsScraper:
         # Now collect all links with GUIDs from the API section
         # Use a more specific selector to get only API-related links
         api_section = await page.query_selector('li.node-tree-item[data-id="Alias-API_id"]')
+        # One round-trip returns every new GUID link; duplicates (the same
+        # page listed under several sections) never leave the browser
+        links = await page.evaluate(_COLLECT_LINKS_JS, {
+            "root": api_section,
+            "guidPattern": _RE_GUID.pattern,
+            "seen": list(self.visited_guids),
+        })
         if api_section:
-            links = await api_section.query_selector_all('a[href*="guid=GUID"]')
-            print(f"Found {len(links)} links with GUIDs under API section")
+            print(f"Found {len(links)} unique GUID links under API section")
         else:
-            # Fallback: get all GUID links
-            links = await page.query_selector_all('a[href*="guid=GUID"]')
-            print(f"Found {len(links)} total links with GUIDs (fallback)")
+            # Fallback: all GUID links on the page
+            print(f"Found {len(links)} unique GUID links in total (fallback)")
         
         for link in links:
-            try:
-                href = await link.get_attribute("href")
-                title = await link.inner_text()
-                title = title.strip() if title else ""
-                
-                # Skip empty titles
-                if not title:
-                    continue
-                
-                # Extract GUID from URL
-                guid_match = re.search(r'guid=(GUID-[A-F0-9a-f-]+)', href or "")
-                if guid_match and guid_match.group(1) not in self.visited_guids:
-                    guid = guid_match.group(1)
-                    self.visited_guids.add(guid)
-                    
-                    # Build full URL
-                    if href.startswith("http"):
-                        full_url = href
-                    else:
-                        full_url = f"{BASE_URL}?guid={guid}"
-                    
-                    pages.append({
-                        "url": full_url,
-                        "title": title,
-                        "guid": guid
-                    })
-            except Exception as e:
-                print(f"Error processing link: {e}")
-                continue
+            href = link["href"]
+            guid = link["guid"]
+            self.visited_guids.add(guid)
+            
+            # Build full URL
+            if href.startswith("http"):
+                full_url = href
+            else:
+                full_url = f"{BASE_URL}?guid={guid}"
+            
+            pages.append({
+                "url": full_url,
+                "title": link["title"],
+                "guid": guid
+            })
         
         return pages
 
@@ -173,139 +311,235 @@ class AutodeskDocsScraper:
         Recursively expand all subsections under the API section.
         This ensures we discover ALL pages including deeply nested ones like class references.
         """
-        total_expanded = 0
-        
-        for depth in range(max_depth):
-            # Find all collapsed items WITHIN the API section
-            # Items are collapsed if they have aria-expanded="false" and have an expand button
-            collapsed_items = await api_section.query_selector_all(
-                'li.node-tree-item[aria-expanded="false"] > span.expand-collapse'
-            )
-            
-            if not collapsed_items:
-                print(f"No more collapsed sections to expand (depth {depth})")
-                break
-            
-            print(f"Depth {depth}: Expanding {len(collapsed_items)} collapsed sections...")
-            
-            for btn in collapsed_items:
-                try:
-                    await btn.click()
-                    total_expanded += 1
-                    await asyncio.sleep(0.3)  # Small delay to allow content to load
-                except Exception as e:
-                    pass
-            
-            # Wait for new content to load
-            await asyncio.sleep(1)
-        
+        total_expanded = await page.evaluate(_EXPAND_TREE_JS, [api_section, max_depth, 1000])
         print(f"Total sections expanded: {total_expanded}")
 
     async def _expand_all_sections(self, page: Page, max_iterations: int = 30):
         """Expand all collapsed sections in the navigation tree (fallback method)."""
-        total_expanded = 0
+        total_expanded = await page.evaluate(_EXPAND_TREE_JS, [None, max_iterations, 1000])
+        print(f"Total sections expanded: {total_expanded}")
+
+    def _reuse_cached_pages(self, page_links: list[dict]) -> list[dict]:
+        """
+        Reuse pages saved by a previous run within CACHE_MAX_AGE_DAYS.
+
+        Fresh pages are added to ``scraped_pages`` as-is; the links that
+        still need scraping are returned.
+        """
+        cutoff = datetime.now(timezone.utc) - timedelta(days=CACHE_MAX_AGE_DAYS)
+        remaining = []
         
-        for i in range(max_iterations):
-            # Find collapsed sections using aria-expanded attribute
-            collapsed = await page.query_selector_all(
-                'li.node-tree-item[aria-expanded="false"] > span.expand-collapse'
-            )
-            if not collapsed:
-                break
-            
-            print(f"Expanding {len(collapsed)} collapsed sections (iteration {i+1})...")
-            for btn in collapsed:
-                try:
-                    await btn.click()
-                    total_expanded += 1
-                    await asyncio.sleep(0.2)  # Small delay between clicks
-                except:
-                    pass
-            
-            await asyncio.sleep(1)  # Wait for expansion animation
+        for link in page_links:
+            cached = self.saved_pages.get(link["guid"])
+            try:
+                # astimezone() treats naive timestamps from older runs as local time
+                if cached and datetime.fromisoformat(cached["scraped_at"]).astimezone() >= cutoff:
+                    self.scraped_pages.append(cached)
+                    continue
+            except (KeyError, TypeError, ValueError):
+                pass
+            remaining.append(link)
+        
+        reused = len(page_links) - len(remaining)
+        if reused:
+            print(f"Reusing {reused} pages scraped within the last {CACHE_MAX_AGE_DAYS} days")
+        return remaining
+
+    async def _scrape_all(self, browser: Browser, page_links: list[dict]):
+        """
+        Scrape pages concurrently with up to CONCURRENCY workers.
+
+        Each worker owns one BrowserContext and page, reused for every link it
+        pulls from the shared queue, and sleeps NAVIGATION_DELAY between its
+        own page loads so the per-worker request rate stays unchanged.
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        for i, link in enumerate(page_links):
+            queue.put_nowait((i, link))
+
+        async def worker():
+            context = await browser.new_context()
+            await block_heavy_resources(context)
+            page = await context.new_page()
+            page.set_default_timeout(PAGE_LOAD_TIMEOUT)
+            try:
+                while True:
+                    try:
+                        i, link = queue.get_nowait()
+                    except asyncio.QueueEmpty:
+                        return
+                    print(f"Scraping page {i+1}/{len(page_links)}: {link.get('title', 'Unknown')}")
+                    await self._scrape_page(page, link)
+                    await asyncio.sleep(NAVIGATION_DELAY / 1000)  # Be nice to server
+            finally:
+                await context.close()
+
+        num_workers = min(CONCURRENCY, len(page_links))
+        await asyncio.gather(*(worker() for _ in range(num_workers)))
 
     async def _scrape_page(self, page: Page, link_info: dict):
-        """Scrape content from a single documentation page."""
+        """
+        Scrape content from a single documentation page.
+
+        Once the content endpoint is known, the page HTML is fetched directly
+        over HTTP (sharing the context's cookies) instead of rendering the
+        SPA; rendering remains the fallback.
+        """
         try:
-            await page.goto(link_info["url"])
-            await page.wait_for_load_state("networkidle")
-            await asyncio.sleep(5)  # Wait for JS rendering (5s needed for SPA content)
+            content = ""
+            if self.fragment_url and not self.fragment_blocked:
+                html = await self._fetch_fragment(page, link_info, self.fragment_url)
+                if html:
+                    # Without the .body_content div this isn't the page itself
+                    content = await self._parse_html(html, require_body_content=True)
             
-            # Extract page content
-            content = await self._extract_content(page)
+            if len(content) <= 100:
+                content = await self._render_page(page, link_info)
             
             if content and len(content) > 50:  # Only save meaningful content
-                self.scraped_pages.append({
+                page_data = {
                     "guid": link_info["guid"],
                     "title": link_info["title"],
                     "url": link_info["url"],
                     "content": content,
-                    "scraped_at": datetime.now().isoformat()
-                })
+                    "scraped_at": self.run_started_at,
+                    "scraped_at_offset_ms": int((time.monotonic() - self._run_t0) * 1000),
+                }
+                self.scraped_pages.append(page_data)
+                self._pages_file.write(orjson.dumps(page_data, option=orjson.OPT_APPEND_NEWLINE))
+                if link_info["guid"] in self.saved_pages:
+                    self.superseded += 1
         except Exception as e:
             print(f"Error scraping {link_info['url']}: {e}")
 
-    async def _extract_content(self, page: Page) -> str:
-        """Extract the main content from the page."""
-        # The main content is inside .body_content (discovered via debugging)
-        # Other selectors are fallbacks
-        selectors = [
-            ".body_content",      # Primary - this is where the docs actually live
-            "#body-content",       # Alternative ID selector
-            ".caas_body",          # Fallback
-            "article",             # Fallback
-            "main",                # Fallback
-        ]
+    async def _render_page(self, page: Page, link_info: dict) -> str:
+        """Load a page in the browser and extract its rendered content."""
+        sniffer = None
+        candidates: list[str] = []
+        if self.fragment_url is None and not self.fragment_blocked:
+            sniffer = self._make_fragment_sniffer(link_info["guid"], candidates)
+            page.on("response", sniffer)
         
-        for selector in selectors:
-            try:
-                element = await page.query_selector(selector)
-                if element:
-                    # Get text content, cleaning up whitespace
-                    text = await element.inner_text()
-                    if text and len(text) > 100:  # Only accept meaningful content
-                        # Clean up the text
-                        text = re.sub(r'\n{3,}', '\n\n', text)
-                        text = re.sub(r' {2,}', ' ', text)
-                        return text.strip()
-            except:
-                continue
+        try:
+            await page.goto(link_info["url"], wait_until="domcontentloaded")
+            await wait_for_content(page)  # Wait for JS to render the SPA content
+        finally:
+            if sniffer:
+                page.remove_listener("response", sniffer)
         
-        # Fallback: try to get the main content area more broadly
+        # One HTML transfer, parsed locally
+        content = await self._parse_html(await page.content())
+        if candidates and len(content) > 100:
+            await self._verify_fragment_urls(page, link_info, candidates, content)
+        return content
+
+    async def _parse_html(self, html: str, require_body_content: bool = False) -> str:
+        """
+        Extract the cleaned text content from page HTML.
+
+        Parsing runs in the parse process pool (or a worker thread outside of
+        ``run``) so CPU-bound extraction neither blocks the event loop driving
+        the browser nor contends with it for the GIL. Each scrape worker waits
+        on its own page, so at most CONCURRENCY documents are in flight.
+        """
+        loop = asyncio.get_running_loop()
+        extracted = await loop.run_in_executor(
+            self._parse_pool, extract_content, html, require_body_content
+        )
+        return _clean_text(extracted.get("full_text", ""))
+
+    def _make_fragment_sniffer(self, guid: str, candidates: list[str]):
+        """Build a response listener that collects candidate content endpoint patterns."""
+        def on_response(response):
+            if self.fragment_url is not None:
+                return
+            if response.request.resource_type not in ("xhr", "fetch") or not response.ok:
+                return
+            if guid not in response.url or "html" not in response.headers.get("content-type", ""):
+                return
+            pattern = response.url.replace(guid, GUID_PLACEHOLDER)
+            if pattern not in self._rejected_fragment_urls and pattern not in candidates:
+                candidates.append(pattern)
+        return on_response
+
+    async def _verify_fragment_urls(self, page: Page, link_info: dict,
+                                    candidates: list[str], rendered: str):
+        """
+        Adopt the first candidate endpoint whose direct fetch reproduces the
+        content just rendered for the same page.
+
+        Any HTML response mentioning the GUID (a breadcrumb, a TOC fragment)
+        is a candidate, so each is fetched once and checked for the
+        .body_content div and matching text before it replaces rendering.
+        """
+        for pattern in candidates:
+            if self.fragment_url is not None or self.fragment_blocked:
+                return
+            html = await self._fetch_fragment(page, link_info, pattern)
+            if html and await self._parse_html(html, require_body_content=True) == rendered:
+                if self.fragment_url is None:
+                    self.fragment_url = pattern
+                    print(f"Discovered content endpoint: {pattern}")
+                return
+            self._rejected_fragment_urls.add(pattern)
+
+    async def _fetch_fragment(self, page: Page, link_info: dict, pattern: str) -> str | None:
+        """Fetch a page's HTML from a content endpoint pattern without rendering."""
+        url = pattern.replace(GUID_PLACEHOLDER, link_info["guid"])
         try:
-            # Get everything except navigation - prioritize .body_content
-            content = await page.evaluate('''() => {
-                const main = document.querySelector('.body_content, #body-content, .caas_body, article, main');
-                if (main) return main.innerText;
-                
-                // Fallback: get body but exclude nav
-                const body = document.body.cloneNode(true);
-                const navs = body.querySelectorAll('nav, .toc, .sidebar, .navigation, header, footer');
-                navs.forEach(n => n.remove());
-                return body.innerText;
-            }''')
-            if content:
-                content = re.sub(r'\n{3,}', '\n\n', content)
-                content = re.sub(r' {2,}', ' ', content)
-                return content.strip()
-        except:
-            pass
+            response = await page.context.request.get(url)
+        except Exception as e:
+            print(f"Direct fetch failed for {link_info['guid']}: {e}")
+            return None
+        
+        if response.status == 403:
+            # Blocked by anti-bot protection - render every page from now on
+            print("Direct fetch returned 403, falling back to browser rendering")
+            self.fragment_blocked = True
+            return None
+        if not response.ok:
+            return None
+        return await response.text()
+
+    def _load_saved_pages(self) -> dict[str, dict]:
+        """Load pages saved by previous runs, keyed by GUID (the latest record wins)."""
+        pages = {}
+        if not self.pages_path.exists():
+            return pages
         
-        return ""
+        try:
+            with gzip.open(self.pages_path, 'rb') as f:
+                for line in f:
+                    try:
+                        page_data = orjson.loads(line)
+                        pages[page_data["guid"]] = page_data
+                    except (orjson.JSONDecodeError, KeyError, TypeError):
+                        continue  # e.g. a line cut short by an interrupted run
+        except (EOFError, gzip.BadGzipFile) as e:
+            # An interrupted run leaves a truncated member; keep what was read
+            # and rewrite the file at the end of this run
+            print(f"Warning: {self.pages_path} is truncated ({e}), loaded {len(pages)} pages")
+            self.pages_truncated = True
+        return pages
 
     def _save_results(self):
-        """Save scraped pages to JSON files."""
-        # Save individual page files
-        for page_data in self.scraped_pages:
-            filename = f"{page_data['guid']}.json"
-            filepath = self.output_dir / filename
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(page_data, f, indent=2, ensure_ascii=False)
+        """Save the index of scraped pages and compact the pages file."""
+        # Re-scraped pages were appended after their old records; rewrite the
+        # file once so it holds a single record per GUID. Also rewrite it if
+        # it was truncated, as nothing after the damaged member is readable.
+        if self.superseded or self.pages_truncated:
+            pages = dict(self.saved_pages)
+            pages.update((p["guid"], p) for p in self.scraped_pages)
+            tmp_path = self.pages_path.with_name(self.pages_path.name + ".tmp")
+            with gzip.open(tmp_path, 'wb', compresslevel=6) as f:
+                for page_data in pages.values():
+                    f.write(orjson.dumps(page_data, option=orjson.OPT_APPEND_NEWLINE))
+            tmp_path.replace(self.pages_path)
         
         # Save an index file with all pages
         index = {
             "total_pages": len(self.scraped_pages),
-            "scraped_at": datetime.now().isoformat(),
+            "scraped_at": self.run_started_at,
             "pages": [
                 {
                     "guid": p["guid"],
@@ -316,18 +550,19 @@ class AutodeskDocsScraper:
             ]
         }
         
-        with open(self.output_dir / "index.json", 'w', encoding='utf-8') as f:
-            json.dump(index, f, indent=2, ensure_ascii=False)
+        with open(self.output_dir / "index.json", 'wb') as f:
+            f.write(orjson.dumps(index, option=orjson.OPT_INDENT_2))
 
 
-async def main(test_mode: bool = False, headless: bool = False):
+async def main(test_mode: bool = False, headless: bool = False, refresh: bool = False):
     """Run the scraper."""
     scraper = AutodeskDocsScraper()
-    await scraper.run(test_mode=test_mode, headless=headless)
+    await scraper.run(test_mode=test_mode, headless=headless, refresh=refresh)
 
 
 if __name__ == "__main__":
     import sys
     test_mode = "--test" in sys.argv
     headless = "--headless" in sys.argv  # Add --headless flag to run without browser window
-    asyncio.run(main(test_mode=test_mode, headless=headless))
+    refresh = "--refresh" in sys.argv  # Add --refresh flag to ignore previously scraped pages
+    asyncio.run(main(test_mode=test_mode, headless=headless, refresh=refresh))
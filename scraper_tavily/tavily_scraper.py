@@ -9,58 +9,63 @@ Usage:
     python scraper_tavily/tavily_scraper.py              # Scrape all pages
     python scraper_tavily/tavily_scraper.py --test        # Scrape 3 test pages
     python scraper_tavily/tavily_scraper.py --test -n 5   # Scrape 5 test pages
+    python scraper_tavily/tavily_scraper.py --ignore-cache  # Bypass cached API responses
+    python scraper_tavily/tavily_scraper.py --migrate  # Split old flat page files into raw/ + clean/
 """
 
 import argparse
-import json
+import gzip
+import hashlib
 import os
 import re
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # ─── Configuration ───────────────────────────────────────────────────────────
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 INDEX_PATH = PROJECT_ROOT / "data" / "docs" / "index.json"
 OUTPUT_DIR = PROJECT_ROOT / "data" / "docs_tavily"
+CACHE_DIR = OUTPUT_DIR / "_cache"  # raw API responses, one file per URL
+RAW_DIR = OUTPUT_DIR / "raw"       # full pages incl. raw_content (scraper only)
+CLEAN_DIR = OUTPUT_DIR / "clean"   # pages without raw_content (read by the servers)
+CORPUS_PATH = CLEAN_DIR / "corpus.jsonl.gz"  # every clean page in one gzipped file
 
 TAVILY_EXTRACT_URL = "https://api.tavily.com/extract"
+EXTRACT_DEPTH = "advanced"
+CACHE_VERSION = "v1"    # bump to invalidate cached extractions
 BATCH_SIZE = 5          # Tavily extract supports up to 5 URLs per call
-DELAY_BETWEEN_BATCHES = 2  # seconds
+BATCH_WORKERS = 4       # batches in flight at once
+MIN_BATCH_INTERVAL = 0.5  # seconds between batch starts (API rate limit)
+MAX_RETRIES = 5         # retries for rate-limited / transient API errors
 
 
 # ─── Content Cleaning ───────────────────────────────────────────────────────
 
-# Patterns that indicate navigation/sidebar content to strip
+# Patterns that indicate navigation/sidebar content to strip. They are only
+# ever matched at the start of a single line, so a pattern stops at the prefix
+# that decides it: a trailing ".*$" would only add backtracking work.
 NAV_PATTERNS = [
-    # Breadcrumb trails like "1.   Alias Programmers'..."
-    r'^\d+\.\s+Alias Programmers.*$',
-    r'^\d+\.\s+Adding your plug-in.*$',
-    r'^\d+\.\s+[A-Z].*$',
+    # Breadcrumb trails like "1.   Alias Programmers'..." or "2.   Adding your plug-in"
+    r'^\d+\.\s+[A-Z]',
     # Share links
     r'^Share\s*$',
     r'^\s*(Email|Facebook|Twitter|LinkedIn)\s*$',
-    # Navigation sidebar items (indented with spaces, tree-like)
-    r'^\s{2,}(Adding your plug-in|Building Options|Building the included|'
-    r'Class reference|Compiling and linking|Implementation Details|'
-    r'Introduction|Plug-in API Examples|Setting up plug-ins|'
-    r'The universe and its objects|Using OpenAlias|Using the API|'
-    r'Writing a plug-in|Alias Installation|Legacy Getting Started|'
-    r'Alias What\'s New|What\'s New in|Alias Release Notes|'
-    r'Tutorials|Interface Reference|Tool Palette Reference|'
-    r'Menus Reference|File Format Reference|VRED Renderer|'
-    r'Live Referencing|Alias Dynamo|Flow Production|'
-    r'Form Explorer|NavPack Design|Environment Variables).*$',
+    # Navigation sidebar items are checked separately (see SIDEBAR_ITEMS)
     # Copyright / license notices
-    r'^Except where otherwise noted.*Creative Commons.*$',
-    r'^Please see the Autodesk Creative Commons.*$',
-    # Page header boilerplate
-    r'^Alias 2026 Help \|.*\| Autodesk\s*$',
-    r'^Alias 2026 Help \|.*$',
+    r'^Except where otherwise noted.*Creative Commons',
+    r'^Please see the Autodesk Creative Commons',
+    # Page header boilerplate ("Alias 2026 Help | ... | Autodesk")
+    r'^Alias 2026 Help \|',
     r'^\s*Help Home\s*$',
     r'^\s*Quick Links\s*$',
     r'^\s*Sign In\s*$',
@@ -68,18 +73,39 @@ NAV_PATTERNS = [
     r'^\s*简体中文\s*$',
     r'^\s*日本語\s*$',
     r'^\s*한국어\s*$',
-    r'^Image \d+:.*$',
+    r'^Image \d+:',
     # Sidebar section headers
     r'^\s*(Essential Skills|Essential Concepts|The Alias Workspace|'
-    r'Keyboard Shortcuts|Subdivision Modeling).*$',
+    r'Keyboard Shortcuts|Subdivision Modeling)',
     r'^\s*What\'s New\s*$',
     r'^\s*Release Notes\s*$',
     # "Parent page:" lines (keep context but these are nav)
     # We keep these as they provide useful hierarchy info
 ]
 
-# Compile nav patterns for performance
-NAV_REGEX = [re.compile(p, re.MULTILINE) for p in NAV_PATTERNS]
+# Navigation sidebar items: lines indented by 2+ whitespace characters that
+# start with one of these (tree-like). Checked with str.startswith, which is
+# cheaper than a regex and only runs on indented lines.
+SIDEBAR_ITEMS = (
+    "Adding your plug-in", "Building Options", "Building the included",
+    "Class reference", "Compiling and linking", "Implementation Details",
+    "Introduction", "Plug-in API Examples", "Setting up plug-ins",
+    "The universe and its objects", "Using OpenAlias", "Using the API",
+    "Writing a plug-in", "Alias Installation", "Legacy Getting Started",
+    "Alias What's New", "What's New in", "Alias Release Notes",
+    "Tutorials", "Interface Reference", "Tool Palette Reference",
+    "Menus Reference", "File Format Reference", "VRED Renderer",
+    "Live Referencing", "Alias Dynamo", "Flow Production",
+    "Form Explorer", "NavPack Design", "Environment Variables",
+)
+
+# All nav patterns fused into one alternation, so filtering a line is a
+# single regex match instead of one per pattern (every pattern is ^-anchored)
+NAV_REGEX = re.compile("|".join(f"(?:{p})" for p in NAV_PATTERNS), re.MULTILINE)
+
+
+# Headings in the page header that don't start the content
+NON_CONTENT_HEADINGS = ('help home', 'quick links', 'sign in', 'english')
 
 
 def clean_content(raw_content: str, page_title: str) -> str:
@@ -90,58 +116,49 @@ def clean_content(raw_content: str, page_title: str) -> str:
     if not raw_content:
         return ""
 
-    lines = raw_content.split('\n')
+    # Lines that mark the start of the content: the page title, bare or as a heading
+    title_lines = {page_title, f"# {page_title}", f"## {page_title}", f"### {page_title}"}
+
     cleaned_lines = []
+    keep = cleaned_lines.append
     in_code_block = False
     found_content_start = False
 
-    for line in lines:
+    for line in raw_content.split('\n'):
+        # Stripped once; every check below reuses it
+        stripped = line.strip()
+
         # Track code blocks - never strip content inside them
-        if line.strip().startswith('```'):
+        if stripped.startswith('```'):
             in_code_block = not in_code_block
             if found_content_start:
-                cleaned_lines.append(line)
+                keep(line)
             continue
 
         if in_code_block:
             if found_content_start:
-                cleaned_lines.append(line)
+                keep(line)
             continue
 
         # Try to find the actual content start (the page title or first heading)
         if not found_content_start:
-            stripped = line.strip()
-            # Look for the page title as a heading or standalone text
+            # Look for the page title as a heading or standalone text, or
+            # any heading that looks like content; skip everything else
             if stripped and (
-                stripped == page_title
-                or stripped == f"# {page_title}"
-                or stripped == f"## {page_title}"
-                or stripped == f"### {page_title}"
-            ):
-                found_content_start = True
-                cleaned_lines.append(line)
-                continue
-            # Also match if we see a heading that looks like content
-            if stripped.startswith('#') and not any(
-                kw in stripped.lower() for kw in [
-                    'help home', 'quick links', 'sign in', 'english'
-                ]
+                stripped in title_lines
+                or (stripped[0] == '#' and not any(
+                    kw in stripped.lower() for kw in NON_CONTENT_HEADINGS
+                ))
             ):
                 found_content_start = True
-                cleaned_lines.append(line)
-                continue
-            # Skip everything before content starts
+                keep(line)
             continue
 
         # Once in content, filter out remaining nav noise
-        should_skip = False
-        for pattern in NAV_REGEX:
-            if pattern.match(line):
-                should_skip = True
-                break
-
-        if not should_skip:
-            cleaned_lines.append(line)
+        if line[:2].isspace() and stripped.startswith(SIDEBAR_ITEMS):
+            continue
+        if not NAV_REGEX.match(line):
+            keep(line)
 
     result = '\n'.join(cleaned_lines).strip()
 
@@ -156,26 +173,39 @@ def clean_content(raw_content: str, page_title: str) -> str:
     return result
 
 
+# Known footer markers, searched for in one pass
+FOOTER_MARKERS = [
+    "### Was this information helpful?",
+    "Was this information helpful?",
+    "Except where otherwise noted, this work is licensed",
+    "[](https://creativecommons.org/",
+    "Privacy Statement",
+    "Legal Notices & Trademarks",
+    "Report Noncompliance",
+    "© 2025 Autodesk Inc.",
+    "© 2024 Autodesk Inc.",
+    "© 2026 Autodesk Inc.",
+]
+FOOTER_REGEX = re.compile("|".join(map(re.escape, FOOTER_MARKERS)))
+
+# Obvious nav/boilerplate for the fallback cleaner: lines containing one of
+# the keywords, or consisting of exactly one of the share labels
+SIMPLE_NAV_KEYWORDS = [
+    'Help Home', 'Quick Links', 'Sign In',
+    'English (US)', '简体中文', '日本語', '한국어',
+    'Creative Commons', 'Autodesk Creative Commons',
+    'Image 2: Alias 2026',
+]
+SIMPLE_NAV_REGEX = re.compile("|".join(map(re.escape, SIMPLE_NAV_KEYWORDS)))
+SIMPLE_NAV_EXACT = frozenset({'Share', 'Email', 'Facebook', 'Twitter', 'LinkedIn'})
+
+
 def _strip_footer(content: str) -> str:
     """Remove footer boilerplate from the end of the content."""
-    # Known footer markers - truncate at the first one found
-    footer_markers = [
-        "### Was this information helpful?",
-        "Was this information helpful?",
-        "Except where otherwise noted, this work is licensed",
-        "[](https://creativecommons.org/",
-        "Privacy Statement",
-        "Legal Notices & Trademarks",
-        "Report Noncompliance",
-        "© 2025 Autodesk Inc.",
-        "© 2024 Autodesk Inc.",
-        "© 2026 Autodesk Inc.",
-    ]
-    for marker in footer_markers:
-        idx = content.find(marker)
-        if idx > 0:
-            content = content[:idx].rstrip()
-            break
+    # Truncate at the earliest footer marker (one not at the very start)
+    match = FOOTER_REGEX.search(content, 1)
+    if match:
+        content = content[:match.start()].rstrip()
     return content
 
 
@@ -188,14 +218,7 @@ def _simple_clean(raw_content: str) -> str:
     for line in lines:
         stripped = line.strip()
         # Skip obvious nav/boilerplate
-        if any(kw in stripped for kw in [
-            'Help Home', 'Quick Links', 'Sign In',
-            'English (US)', '简体中文', '日本語', '한국어',
-            'Creative Commons', 'Autodesk Creative Commons',
-            'Image 2: Alias 2026',
-        ]):
-            continue
-        if stripped in ('Share', 'Email', 'Facebook', 'Twitter', 'LinkedIn'):
+        if stripped in SIMPLE_NAV_EXACT or SIMPLE_NAV_REGEX.search(stripped):
             continue
         cleaned.append(line)
     return '\n'.join(cleaned).strip()
@@ -217,14 +240,13 @@ def get_api_key() -> str:
     for config_path in mcp_config_paths:
         if config_path.exists():
             try:
-                with open(config_path, 'r') as f:
-                    config = json.load(f)
+                config = orjson.loads(config_path.read_bytes())
                 tavily_cfg = config.get("mcpServers", {}).get("tavily", {})
                 args = tavily_cfg.get("args", [])
                 for arg in args:
                     if "tavilyApiKey=" in str(arg):
                         return str(arg).split("tavilyApiKey=")[1]
-            except (json.JSONDecodeError, KeyError):
+            except (orjson.JSONDecodeError, KeyError):
                 pass
 
     print("ERROR: No Tavily API key found.")
@@ -232,31 +254,108 @@ def get_api_key() -> str:
     sys.exit(1)
 
 
-def extract_batch(urls: list[str], api_key: str) -> dict:
+def _make_session() -> requests.Session:
+    """HTTP session that keeps the TLS connection to Tavily alive across batches."""
+    session = requests.Session()
+    retry = Retry(
+        total=MAX_RETRIES,
+        backoff_factor=1,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=frozenset({"POST"}),  # extract calls are safe to repeat
+    )
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry))
+    return session
+
+
+_SESSION = _make_session()
+
+_throttle_lock = threading.Lock()
+_next_batch_at = 0.0
+
+
+def _throttle():
+    """Block until the next batch may start, spacing starts MIN_BATCH_INTERVAL apart."""
+    global _next_batch_at
+    with _throttle_lock:
+        now = time.monotonic()
+        wait = _next_batch_at - now
+        _next_batch_at = max(now, _next_batch_at) + MIN_BATCH_INTERVAL
+    if wait > 0:
+        time.sleep(wait)
+
+
+def _cache_path(url: str) -> Path:
+    """Cache file for a URL, keyed by everything that affects the API response."""
+    key = hashlib.sha256(f"{url}\0{EXTRACT_DEPTH}\0{CACHE_VERSION}".encode("utf-8")).hexdigest()
+    return CACHE_DIR / f"{key}.json"
+
+
+def _load_cached(url: str) -> dict | None:
+    """Return the cached extraction for a URL, or None on a miss."""
+    try:
+        return orjson.loads(_cache_path(url).read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return None
+
+
+def _save_cached(url: str, extracted: dict):
+    """Cache an extraction; written to a temp file first so a crash never leaves a torn entry."""
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    path = _cache_path(url)
+    tmp = path.with_suffix(".tmp")
+    tmp.write_bytes(orjson.dumps({
+        "url": url,
+        **extracted,
+        "fetched_at": datetime.now(timezone.utc).isoformat(),
+    }))
+    os.replace(tmp, path)
+
+
+def extract_batch(urls: list[str], api_key: str, use_cache: bool = True) -> dict:
     """
     Call Tavily Extract API for a batch of URLs.
     Returns a dict mapping URL -> extracted content.
+
+    URLs already in the on-disk cache are served from it without an API call
+    (unless use_cache is False); fresh extractions are added to the cache.
     """
+    result = {}
+    to_fetch = []
+    for url in urls:
+        cached = _load_cached(url) if use_cache else None
+        if cached is not None:
+            result[url] = {
+                "title": cached.get("title", ""),
+                "raw_content": cached.get("raw_content", ""),
+            }
+        else:
+            to_fetch.append(url)
+
+    if not to_fetch:
+        return result
+
     payload = {
         "api_key": api_key,
-        "urls": urls,
-        "extract_depth": "advanced",
+        "urls": to_fetch,
+        "extract_depth": EXTRACT_DEPTH,
     }
 
+    _throttle()
     try:
-        resp = requests.post(TAVILY_EXTRACT_URL, json=payload, timeout=60)
+        resp = _SESSION.post(TAVILY_EXTRACT_URL, json=payload, timeout=60)
         resp.raise_for_status()
         data = resp.json()
     except requests.exceptions.RequestException as e:
         print(f"  ERROR: API request failed: {e}")
-        return {}
+        return result
 
-    result = {}
     for item in data.get("results", []):
-        result[item["url"]] = {
+        extracted = {
             "title": item.get("title", ""),
             "raw_content": item.get("raw_content", ""),
         }
+        result[item["url"]] = extracted
+        _save_cached(item["url"], extracted)
 
     for item in data.get("failed_results", []):
         print(f"  WARN: Failed to extract {item.get('url')}: {item.get('error')}")
@@ -268,17 +367,69 @@ def extract_batch(urls: list[str], api_key: str) -> dict:
 
 def load_index() -> list[dict]:
     """Load the existing index.json with all page GUIDs."""
-    with open(INDEX_PATH, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    data = orjson.loads(INDEX_PATH.read_bytes())
     return data.get("pages", [])
 
 
 def save_page(page_data: dict):
-    """Save a scraped page as JSON."""
-    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-    filepath = OUTPUT_DIR / f"{page_data['guid']}.json"
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(page_data, f, indent=2, ensure_ascii=False)
+    """
+    Save a scraped page as compact JSON (only read by programs; index.json stays indented).
+
+    The full page goes to RAW_DIR; a copy without ``raw_content`` goes to
+    CLEAN_DIR, so the servers never load the large uncleaned text.
+    """
+    RAW_DIR.mkdir(parents=True, exist_ok=True)
+    CLEAN_DIR.mkdir(parents=True, exist_ok=True)
+    filename = f"{page_data['guid']}.json"
+    (RAW_DIR / filename).write_bytes(orjson.dumps(page_data))
+    clean = {k: v for k, v in page_data.items() if k != "raw_content"}
+    (CLEAN_DIR / filename).write_bytes(orjson.dumps(clean))
+
+
+def migrate_legacy_pages() -> int:
+    """
+    Split page files saved directly in OUTPUT_DIR by older versions into RAW_DIR + CLEAN_DIR.
+
+    Returns the number of pages migrated; each old file is removed once both
+    copies are written. Files that can't be read or aren't a page with a
+    ``guid`` are reported and left in place.
+    """
+    count = 0
+    for path in sorted(OUTPUT_DIR.glob("GUID-*.json")):
+        try:
+            save_page(orjson.loads(path.read_bytes()))
+        except (OSError, orjson.JSONDecodeError, KeyError, TypeError) as e:
+            print(f"  WARN: Not migrating unreadable {path.name}: {e!r}")
+            continue
+        path.unlink()
+        count += 1
+    return count
+
+
+def save_corpus() -> int:
+    """
+    Consolidate every scraped page into CORPUS_PATH, one compact JSON per line.
+
+    Built from CLEAN_DIR, so it carries no ``raw_content``. The servers load
+    this single file instead of opening each GUID-*.json;
+    gzip shrinks the text-heavy corpus several times over, cutting the bytes
+    read on server start.
+    Returns the number of pages written.
+    """
+    count = 0
+    CLEAN_DIR.mkdir(parents=True, exist_ok=True)
+    tmp = CORPUS_PATH.with_suffix(".tmp")
+    with gzip.open(tmp, 'wb', compresslevel=6) as f:
+        for path in sorted(CLEAN_DIR.glob("GUID-*.json")):
+            try:
+                page_data = orjson.loads(path.read_bytes())
+            except orjson.JSONDecodeError as e:
+                print(f"  WARN: Skipping unreadable {path.name}: {e}")
+                continue
+            f.write(orjson.dumps(page_data, option=orjson.OPT_APPEND_NEWLINE))
+            count += 1
+    os.replace(tmp, CORPUS_PATH)
+    return count
 
 
 def save_index(pages_scraped: list[dict], total_pages: int):
@@ -291,16 +442,68 @@ def save_index(pages_scraped: list[dict], total_pages: int):
         "pages": pages_scraped,
     }
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-    with open(OUTPUT_DIR / "index.json", 'w', encoding='utf-8') as f:
-        json.dump(index, f, indent=2, ensure_ascii=False)
+    (OUTPUT_DIR / "index.json").write_bytes(orjson.dumps(index, option=orjson.OPT_INDENT_2))
+
+
+def scrape_batch(batch: list[dict], api_key: str, use_cache: bool = True) -> list[dict]:
+    """
+    Extract, clean and save one batch of pages; returns their index entries.
+
+    Runs on a worker thread, so each page's raw content is written to disk and
+    released as soon as it's cleaned instead of being handed back.
+    """
+    results = extract_batch([p["url"] for p in batch], api_key, use_cache=use_cache)
+    entries = []
+
+    for page in batch:
+        url = page["url"]
+        extracted = results.pop(url, None)
+        if extracted is None:
+            entries.append({
+                "guid": page["guid"],
+                "title": page["title"],
+                "url": url,
+                "has_code_blocks": False,
+                "content_length": 0,
+                "error": "extraction_failed",
+            })
+            continue
+
+        raw = extracted.get("raw_content", "")
+        cleaned = clean_content(raw, page["title"])
+        has_code = "```" in raw
+
+        save_page({
+            "guid": page["guid"],
+            "title": page["title"],
+            "url": url,
+            "raw_content": raw,
+            "content": cleaned,
+            "has_code_blocks": has_code,
+            "scraped_at": datetime.now(timezone.utc).isoformat(),
+        })
+
+        entries.append({
+            "guid": page["guid"],
+            "title": page["title"],
+            "url": url,
+            "has_code_blocks": has_code,
+            "content_length": len(cleaned),
+        })
 
+    return entries
 
-def scrape(test_mode: bool = False, test_count: int = 3):
+
+def scrape(test_mode: bool = False, test_count: int = 3, ignore_cache: bool = False):
     """Main scraping function."""
     api_key = get_api_key()
     pages = load_index()
     total = len(pages)
 
+    migrated = migrate_legacy_pages() if OUTPUT_DIR.exists() else 0
+    if migrated:
+        print(f"Migrated {migrated} old page files into {RAW_DIR} and {CLEAN_DIR}")
+
     if test_mode:
         # Pick a diverse sample: one with code, one class ref, one intro
         test_guids = [
@@ -320,8 +523,8 @@ def scrape(test_mode: bool = False, test_count: int = 3):
 
     # Check which pages already exist (resume support)
     existing = set()
-    if OUTPUT_DIR.exists():
-        for f in OUTPUT_DIR.glob("GUID-*.json"):
+    if RAW_DIR.exists():
+        for f in RAW_DIR.glob("GUID-*.json"):
             existing.add(f.stem)
 
     pages_to_scrape = [p for p in pages if p["guid"] not in existing]
@@ -331,76 +534,46 @@ def scrape(test_mode: bool = False, test_count: int = 3):
 
     if not pages_to_scrape:
         print("All pages already scraped!")
+        print(f"Corpus: {save_corpus()} pages in {CORPUS_PATH}")
         return
 
-    # Batch and scrape
+    # Batch and scrape: batches run concurrently (rate-limited in
+    # extract_batch); each worker cleans and saves its own pages and returns
+    # only their small index entries, reported here in batch order
     scraped_index = []
-    total_batches = (len(pages_to_scrape) + BATCH_SIZE - 1) // BATCH_SIZE
-
-    for batch_idx in range(0, len(pages_to_scrape), BATCH_SIZE):
-        batch = pages_to_scrape[batch_idx:batch_idx + BATCH_SIZE]
-        batch_num = batch_idx // BATCH_SIZE + 1
-        urls = [p["url"] for p in batch]
-
-        print(f"\n[Batch {batch_num}/{total_batches}] Extracting {len(batch)} pages...")
-        for p in batch:
-            print(f"  - {p['title']}")
-
-        results = extract_batch(urls, api_key)
-
-        for page in batch:
-            url = page["url"]
-            if url in results:
-                extracted = results[url]
-                raw = extracted.get("raw_content", "")
-                cleaned = clean_content(raw, page["title"])
-                has_code = "```" in raw
-
-                page_data = {
-                    "guid": page["guid"],
-                    "title": page["title"],
-                    "url": url,
-                    "raw_content": raw,
-                    "content": cleaned,
-                    "has_code_blocks": has_code,
-                    "scraped_at": datetime.now(timezone.utc).isoformat(),
-                }
-                save_page(page_data)
-
-                scraped_index.append({
-                    "guid": page["guid"],
-                    "title": page["title"],
-                    "url": url,
-                    "has_code_blocks": has_code,
-                    "content_length": len(cleaned),
-                })
-
-                status = "✓" if cleaned else "⚠ empty"
-                code_tag = " [has code]" if has_code else ""
-                print(f"  ✓ {page['title']} ({len(cleaned)} chars){code_tag}")
-            else:
-                print(f"  ✗ FAILED: {page['title']}")
-                scraped_index.append({
-                    "guid": page["guid"],
-                    "title": page["title"],
-                    "url": url,
-                    "has_code_blocks": False,
-                    "content_length": 0,
-                    "error": "extraction_failed",
-                })
-
-        # Delay between batches (not after the last one)
-        if batch_idx + BATCH_SIZE < len(pages_to_scrape):
-            print(f"  Waiting {DELAY_BETWEEN_BATCHES}s before next batch...")
-            time.sleep(DELAY_BETWEEN_BATCHES)
+    batches = [
+        pages_to_scrape[i:i + BATCH_SIZE]
+        for i in range(0, len(pages_to_scrape), BATCH_SIZE)
+    ]
+    total_batches = len(batches)
+    print(f"Extracting {total_batches} batches, {BATCH_WORKERS} at a time...")
+
+    with ThreadPoolExecutor(max_workers=BATCH_WORKERS) as executor:
+        all_entries = executor.map(
+            lambda batch: scrape_batch(batch, api_key, use_cache=not ignore_cache),
+            batches,
+        )
+
+        for batch_num, entries in enumerate(all_entries, 1):
+            extracted = sum(1 for e in entries if not e.get("error"))
+            print(f"\n[Batch {batch_num}/{total_batches}] Extracted {extracted}/{len(entries)} pages")
+
+            for entry in entries:
+                if entry.get("error"):
+                    print(f"  ✗ FAILED: {entry['title']}")
+                else:
+                    code_tag = " [has code]" if entry["has_code_blocks"] else ""
+                    print(f"  ✓ {entry['title']} ({entry['content_length']} chars){code_tag}")
+            scraped_index.extend(entries)
 
     # Also include previously scraped pages in index
-    for f in OUTPUT_DIR.glob("GUID-*.json"):
+    indexed_guids = {p["guid"] for p in scraped_index}
+    for f in CLEAN_DIR.glob("GUID-*.json"):
         guid = f.stem
-        if not any(p["guid"] == guid for p in scraped_index):
+        if guid not in indexed_guids:
+            indexed_guids.add(guid)
             try:
-                with open(f, 'r', encoding='utf-8') as fh:
-                    data = json.load(fh)
+                data = orjson.loads(f.read_bytes())
                 scraped_index.append({
                     "guid": guid,
                     "title": data.get("title", ""),
@@ -408,10 +581,11 @@ def scrape(test_mode: bool = False, test_count: int = 3):
                     "has_code_blocks": data.get("has_code_blocks", False),
                     "content_length": len(data.get("content", "")),
                 })
-            except (json.JSONDecodeError, KeyError):
+            except (orjson.JSONDecodeError, KeyError):
                 pass
 
     save_index(scraped_index, total)
+    corpus_count = save_corpus()
 
     # Summary
     success = sum(1 for p in scraped_index if p.get("content_length", 0) > 0)
@@ -421,6 +595,7 @@ def scrape(test_mode: bool = False, test_count: int = 3):
     print(f"DONE: {success} scraped, {with_code} with code blocks, {failed} failed")
     print(f"Output: {OUTPUT_DIR}")
     print(f"Index:  {OUTPUT_DIR / 'index.json'}")
+    print(f"Corpus: {CORPUS_PATH} ({corpus_count} pages)")
 
 
 if __name__ == "__main__":
@@ -435,5 +610,16 @@ if __name__ == "__main__":
         "-n", type=int, default=3,
         help="Number of pages to scrape in test mode (default: 3)"
     )
+    parser.add_argument(
+        "--ignore-cache", action="store_true",
+        help="Re-extract pages from the API even if a cached response exists"
+    )
+    parser.add_argument(
+        "--migrate", action="store_true",
+        help="Only split old page files into raw/ and clean/ and rebuild the corpus"
+    )
     args = parser.parse_args()
-    scrape(test_mode=args.test, test_count=args.n)
+    if args.migrate:
+        print(f"Migrated {migrate_legacy_pages()} page files; corpus has {save_corpus()} pages")
+    else:
+        scrape(test_mode=args.test, test_count=args.n, ignore_cache=args.ignore_cache)
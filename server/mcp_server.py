@@ -5,9 +5,16 @@ This MCP server provides search capabilities over the scraped Autodesk Alias
 Python API documentation.
 """
 
-import json
+import functools
+import gzip
+import heapq
 import os
+import re
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+
+import orjson
 from mcp.server.fastmcp import FastMCP
 
 # Initialize the MCP server
@@ -16,84 +23,255 @@ mcp = FastMCP("autodesk-alias-docs")
 # Path to scraped documentation
 DOCS_DIR = Path(__file__).parent.parent / "data" / "docs"
 
+# Append-only gzipped file written by the scraper, one page per line
+PAGES_FILE = DOCS_DIR / "pages.jsonl.gz"
+
+
+def _add_search_fields(doc: dict) -> dict:
+    """Lowercase a doc's title and content once at load time, for every search to reuse."""
+    doc["_title_lower"] = doc.get("title", "").lower()
+    doc["_content_lower"] = doc.get("content", "").lower()
+    return doc
+
+
+def _title_lower(doc: dict) -> str:
+    """A doc's lowercased title, also for docs that didn't go through ``_add_search_fields``."""
+    return doc.get("_title_lower") or doc.get("title", "").lower()
+
+
+def _content_lower(doc: dict) -> str:
+    """A doc's lowercased content, also for docs that didn't go through ``_add_search_fields``."""
+    return doc.get("_content_lower") or doc.get("content", "").lower()
+
 
 def load_documentation() -> list[dict]:
-    """Load all scraped documentation from JSON files."""
+    """
+    Load all scraped documentation.
+    
+    Reads the scraper's ``pages.jsonl.gz`` (the latest record per GUID wins),
+    falling back to the per-page GUID-*.json files of older scraper runs.
+    Each doc gets lowercased ``_title_lower``/``_content_lower`` search fields.
+    """
     docs = []
     
     if not DOCS_DIR.exists():
         return docs
     
-    for json_file in DOCS_DIR.glob("GUID-*.json"):
+    if PAGES_FILE.exists():
+        docs_by_guid = {}
         try:
-            with open(json_file, 'r', encoding='utf-8') as f:
-                doc = json.load(f)
-                docs.append(doc)
-        except Exception as e:
-            print(f"Error loading {json_file}: {e}")
+            with gzip.open(PAGES_FILE, 'rb') as f:
+                for line_no, line in enumerate(f, 1):
+                    if not line.strip():
+                        continue
+                    try:
+                        doc = orjson.loads(line)
+                        docs_by_guid[doc.get("guid")] = doc
+                    except Exception as e:
+                        print(f"Error loading {PAGES_FILE} line {line_no}: {e}")
+        except (EOFError, gzip.BadGzipFile) as e:
+            print(f"Error loading {PAGES_FILE}: {e}")
+        return [_add_search_fields(doc) for doc in docs_by_guid.values()]
+    
+    # One small file per page: read and parse them on a thread pool
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+        for doc in pool.map(_load_doc_file, DOCS_DIR.glob("GUID-*.json")):
+            if doc is not None:
+                docs.append(_add_search_fields(doc))
     
     return docs
 
 
+def _load_doc_file(json_file: Path) -> dict | None:
+    """Parse one GUID-*.json page, or return None if it can't be read."""
+    try:
+        return orjson.loads(json_file.read_bytes())
+    except Exception as e:
+        print(f"Error loading {json_file}: {e}")
+        return None
+
+
+# Words as indexed: runs of these characters in the lowercased text
+TOKEN_RE = re.compile(r"[a-z0-9_]+")
+
+
+def build_index(docs: list[dict]) -> dict:
+    """
+    Build an inverted index over the titles and contents of ``docs``.
+    
+    ``postings`` maps each content token to ``(doc position, count)`` pairs and
+    ``title_postings`` maps each title token to doc positions. The vocabularies
+    are also kept as newline-joined strings so the tokens containing a query
+    term can be found with a single regex scan.
+    """
+    postings: dict[str, list[tuple[int, int]]] = {}
+    title_postings: dict[str, list[int]] = {}
+    
+    for i, doc in enumerate(docs):
+        for token, count in Counter(TOKEN_RE.findall(_content_lower(doc))).items():
+            postings.setdefault(token, []).append((i, count))
+        for token in set(TOKEN_RE.findall(_title_lower(doc))):
+            title_postings.setdefault(token, []).append(i)
+    
+    return {
+        "postings": postings,
+        "title_postings": title_postings,
+        "vocab": "\n".join(postings),
+        "title_vocab": "\n".join(title_postings),
+    }
+
+
+# Index for the cached documentation, rebuilt if a different list is searched
+_index_cache: tuple[list[dict], dict] | None = None
+
+
+def get_index(docs: list[dict]) -> dict:
+    """Get the cached inverted index for ``docs`` or build it."""
+    global _index_cache
+    if _index_cache is None or _index_cache[0] is not docs:
+        _index_cache = (docs, build_index(docs))
+    return _index_cache[1]
+
+
+def _tokens_containing(piece: str, vocab: str) -> list[str]:
+    """Tokens of a newline-joined vocabulary that contain ``piece`` (token characters only)."""
+    return re.findall(f"[a-z0-9_]*{re.escape(piece)}[a-z0-9_]*", vocab)
+
+
+def _term_hits(term: str, docs: list[dict], index: dict) -> tuple[list[int], dict[int, int]]:
+    """
+    Find the docs whose title contains ``term`` and how often it occurs in each content.
+    
+    A term made only of token characters can't straddle a token boundary, so its
+    substring count in a document is the sum, over the document's tokens that
+    contain it, of the token's count times the occurrences of the term in the
+    token. Other terms (e.g. "plug-in") are counted directly, but only in the
+    documents that have a token containing each of the term's word pieces.
+    """
+    if not TOKEN_RE.fullmatch(term):
+        return _scan_term_hits(term, docs, index)
+    
+    title_hits = set()
+    for token in _tokens_containing(term, index["title_vocab"]):
+        title_hits.update(index["title_postings"][token])
+    
+    counts: dict[int, int] = {}
+    for token in _tokens_containing(term, index["vocab"]):
+        occurrences = token.count(term)
+        for i, count in index["postings"][token]:
+            counts[i] = counts.get(i, 0) + count * occurrences
+    
+    return sorted(title_hits), counts
+
+
+def _scan_term_hits(term: str, docs: list[dict], index: dict) -> tuple[list[int], dict[int, int]]:
+    """``_term_hits`` for terms with non-token characters, by substring search of candidate docs."""
+    pieces = TOKEN_RE.findall(term)
+    if not pieces:
+        # Nothing to narrow by (e.g. "()"): every document is a candidate
+        title_candidates = content_candidates = range(len(docs))
+    else:
+        title_candidates = sorted(set.intersection(*(
+            {i for token in _tokens_containing(piece, index["title_vocab"])
+             for i in index["title_postings"][token]}
+            for piece in pieces
+        )))
+        content_candidates = sorted(set.intersection(*(
+            {i for token in _tokens_containing(piece, index["vocab"])
+             for i, _ in index["postings"][token]}
+            for piece in pieces
+        )))
+    
+    title_hits = [i for i in title_candidates if term in _title_lower(docs[i])]
+    counts = {}
+    for i in content_candidates:
+        count = _content_lower(docs[i]).count(term)
+        if count:
+            counts[i] = count
+    return title_hits, counts
+
+
 def search_docs(query: str, docs: list[dict], max_results: int = 5) -> list[dict]:
     """
     Simple keyword-based search over documentation.
     
+    Scores come from the inverted index (see ``build_index``), so only the
+    documents that contain a query term are touched.
     Returns matching documents with relevance scores.
     """
     query_terms = query.lower().split()
-    results = []
+    index = get_index(docs)
+    
+    scores: dict[int, int] = {}
+    matched: dict[int, list[str]] = {}
     
-    for doc in docs:
-        title = doc.get("title", "").lower()
-        content = doc.get("content", "").lower()
-        
-        # Calculate a simple relevance score
-        score = 0
-        matched_terms = []
-        
-        for term in query_terms:
-            # Title matches are worth more
-            if term in title:
-                score += 10
+    for term in query_terms:
+        title_hits, counts = _term_hits(term, docs, index)
+        # Title matches are worth more
+        for i in title_hits:
+            scores[i] = scores.get(i, 0) + 10
+            matched.setdefault(i, []).append(term)
+        # Content matches
+        for i, count in counts.items():
+            scores[i] = scores.get(i, 0) + count
+            matched_terms = matched.setdefault(i, [])
+            if term not in matched_terms:
                 matched_terms.append(term)
-            # Content matches
-            if term in content:
-                score += content.count(term)
-                if term not in matched_terms:
-                    matched_terms.append(term)
-        
-        if score > 0:
+    
+    # Best scores first; ties keep document order
+    top = heapq.nlargest(max_results, sorted(scores), key=scores.__getitem__)
+    
+    results = []
+    for i in top:
+        doc = docs[i]
+        content_lower = _content_lower(doc)
+        results.append({
+            "guid": doc.get("guid"),
+            "title": doc.get("title"),
+            "url": doc.get("url"),
+            "score": scores[i],
+            "matched_terms": matched[i],
             # Extract a relevant snippet
-            snippet = extract_snippet(content, query_terms)
-            
-            results.append({
-                "guid": doc.get("guid"),
-                "title": doc.get("title"),
-                "url": doc.get("url"),
-                "score": score,
-                "matched_terms": matched_terms,
-                "snippet": snippet
-            })
+            "snippet": extract_snippet(content_lower, query_terms, content_lower=content_lower),
+        })
     
-    # Sort by score descending
-    results.sort(key=lambda x: x["score"], reverse=True)
+    return results
+
+
+def _first_term_pos(content_lower: str, query_terms: list[str]) -> int:
+    """
+    Position of the earliest occurrence of any query term, or -1.
     
-    return results[:max_results]
+    Several terms are matched with one alternation regex, so the content is
+    scanned once instead of once per term (``re`` caches the compiled pattern
+    across the snippets of a query).
+    """
+    if not query_terms:
+        return -1
+    if len(query_terms) == 1:
+        return content_lower.find(query_terms[0])
+    match = re.search("|".join(map(re.escape, query_terms)), content_lower)
+    return match.start() if match else -1
 
 
-def extract_snippet(content: str, query_terms: list[str], snippet_length: int = 300) -> str:
-    """Extract a relevant snippet from the content containing query terms."""
-    content_lower = content.lower()
+def extract_snippet(
+    content: str,
+    query_terms: list[str],
+    snippet_length: int = 300,
+    content_lower: str | None = None,
+) -> str:
+    """
+    Extract a relevant snippet from the content containing query terms.
     
-    # Find the first occurrence of any query term
-    best_pos = len(content)
-    for term in query_terms:
-        pos = content_lower.find(term)
-        if pos != -1 and pos < best_pos:
-            best_pos = pos
+    Pass ``content_lower`` when the lowercased content is already at hand.
+    """
+    if content_lower is None:
+        content_lower = content.lower()
     
-    if best_pos == len(content):
+    # Find the first occurrence of any query term in a single scan
+    best_pos = _first_term_pos(content_lower, query_terms)
+    
+    if best_pos == -1:
         # No match found, return the beginning
         return content[:snippet_length] + "..." if len(content) > snippet_length else content
     
@@ -121,9 +299,32 @@ def get_docs() -> list[dict]:
     global _docs_cache
     if _docs_cache is None:
         _docs_cache = load_documentation()
+        # Memoized answers refer to the previous documentation
+        _cached_search.cache_clear()
+        _cached_doc_by_title.cache_clear()
     return _docs_cache
 
 
+@functools.lru_cache(maxsize=256)
+def _cached_search(normalized_query: str, max_results: int) -> tuple[dict, ...]:
+    """
+    ``search_docs`` over the cached documentation, memoized for repeated queries.
+    
+    Keyed by the lowercased, whitespace-normalized query, which is all the
+    search looks at. Callers must not mutate the returned result dicts.
+    """
+    return tuple(search_docs(normalized_query, get_docs(), max_results))
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_doc_by_title(title_lower: str) -> dict | None:
+    """First cached doc whose title contains ``title_lower``, memoized."""
+    for doc in get_docs():
+        if title_lower in doc["_title_lower"]:
+            return doc
+    return None
+
+
 @mcp.tool()
 def search_alias_docs(query: str, max_results: int = 5) -> str:
     """
@@ -141,7 +342,7 @@ def search_alias_docs(query: str, max_results: int = 5) -> str:
     if not docs:
         return "No documentation available. Please run the scraper first: python -m scraper.scraper"
     
-    results = search_docs(query, docs, max_results)
+    results = _cached_search(" ".join(query.lower().split()), max_results)
     
     if not results:
         return f"No results found for: {query}"
@@ -191,16 +392,13 @@ def get_doc_by_title(title: str) -> str:
     Returns:
         The full content of the matching documentation page.
     """
-    docs = get_docs()
-    title_lower = title.lower()
-    
     # Find matching document
-    for doc in docs:
-        if title_lower in doc.get("title", "").lower():
-            output = f"# {doc.get('title')}\n\n"
-            output += f"**URL:** {doc.get('url')}\n\n"
-            output += doc.get("content", "No content available.")
-            return output
+    doc = _cached_doc_by_title(title.lower())
+    if doc is not None:
+        output = f"# {doc.get('title')}\n\n"
+        output += f"**URL:** {doc.get('url')}\n\n"
+        output += doc.get("content", "No content available.")
+        return output
     
     return f"No documentation found matching: {title}"
 
@@ -5,54 +5,283 @@ This MCP server provides search capabilities over the Tavily-scraped
 Autodesk Alias API documentation, which includes properly formatted
 code blocks and cleaner content.
 
-Data source: data/docs_tavily/
+Data source: data/docs_tavily/clean/
 """
 
-import json
+import functools
+import gzip
+import heapq
+import mmap
+import os
+import pickle
 import re
+import sys
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+
+import numpy as np
+import orjson
 from mcp.server.fastmcp import FastMCP
 
 # Initialize the MCP server
 mcp = FastMCP("autodesk-alias-docs")
 
-# Path to Tavily-scraped documentation
-DOCS_DIR = Path(__file__).parent.parent / "data" / "docs_tavily"
+# Path to Tavily-scraped documentation (the cleaned copies, without raw_content)
+DOCS_DIR = Path(__file__).parent.parent / "data" / "docs_tavily" / "clean"
+
+# All pages in one gzipped JSON-lines file, written by the Tavily scraper
+CORPUS_FILE = DOCS_DIR / "corpus.jsonl.gz"
+
+# Older scraper versions saved each page (with raw_content) directly here;
+# read when clean/ doesn't exist yet, until the files are migrated
+LEGACY_DOCS_DIR = DOCS_DIR.parent
+MIGRATE_COMMAND = "python scraper_tavily/tavily_scraper.py --migrate"
+
+# Loaded docs (without their contents) and their search index, pickled so a
+# restart skips parsing and indexing; rebuilt when the scraped data is newer
+# or the format changes. The contents go to a separate file that is
+# memory-mapped and decoded one page at a time.
+SEARCH_CACHE_FILE = DOCS_DIR / "search_cache.pickle"
+SEARCH_CACHE_CONTENTS_FILE = DOCS_DIR / "search_cache.contents"
+SEARCH_CACHE_VERSION = 4
 
 
 # ---------------------------------------------------------------------------
 # Data loading
 # ---------------------------------------------------------------------------
 
+def _add_search_fields(doc: dict) -> dict:
+    """Lowercase a doc's title and content once at load time, for every search to reuse."""
+    doc["_title_lower"] = sys.intern(doc.get("title", "").lower())
+    doc["_content_lower"] = doc.get("content", "").lower()
+    return doc
+
+
 def load_documentation() -> list[dict]:
-    """Load all scraped documentation from JSON files."""
+    """
+    Load all scraped documentation.
+
+    Reads the consolidated corpus.jsonl.gz in one go when it exists, falling
+    back to the per-page JSON files. Without a clean/ directory, page files
+    left in data/docs_tavily/ by older scraper versions are read instead.
+    """
     docs = []
 
     if not DOCS_DIR.exists():
-        return docs
+        return _load_legacy_documentation()
 
-    for json_file in DOCS_DIR.glob("*.json"):
-        if json_file.name == "index.json":
-            continue
+    if CORPUS_FILE.exists():
         try:
-            with open(json_file, "r", encoding="utf-8") as f:
-                doc = json.load(f)
-                docs.append(doc)
-        except Exception as e:
-            print(f"Error loading {json_file}: {e}")
+            with gzip.open(CORPUS_FILE, "rb") as f:
+                for line_no, line in enumerate(f, 1):
+                    if not line.strip():
+                        continue
+                    try:
+                        docs.append(_add_search_fields(orjson.loads(line)))
+                    except Exception as e:
+                        print(f"Error loading {CORPUS_FILE} line {line_no}: {e}")
+        except (EOFError, gzip.BadGzipFile) as e:
+            print(f"Error loading {CORPUS_FILE}: {e}")
+        return docs
+
+    json_files = [path for path in DOCS_DIR.glob("*.json") if path.name != "index.json"]
+    return _load_doc_files(json_files)
 
+
+def _load_legacy_documentation() -> list[dict]:
+    """Load the page files older scraper versions saved directly in LEGACY_DOCS_DIR."""
+    json_files = list(LEGACY_DOCS_DIR.glob("GUID-*.json"))
+    if json_files:
+        print(f"Reading {len(json_files)} legacy page files from {LEGACY_DOCS_DIR}; "
+              f"run `{MIGRATE_COMMAND}` to move them into {DOCS_DIR}")
+    docs = _load_doc_files(json_files)
+    for doc in docs:
+        doc.pop("raw_content", None)
     return docs
 
 
+def _load_doc_files(json_files: list[Path]) -> list[dict]:
+    """Read and parse one small file per page on a thread pool."""
+    docs = []
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as pool:
+        for doc in pool.map(_load_doc_file, json_files):
+            if doc is not None:
+                docs.append(_add_search_fields(doc))
+
+    return docs
+
+
+def _load_doc_file(json_file: Path) -> dict | None:
+    """Parse one page file, or return None if it can't be read."""
+    try:
+        return orjson.loads(json_file.read_bytes())
+    except Exception as e:
+        print(f"Error loading {json_file}: {e}")
+        return None
+
+
+def _source_signature() -> tuple | None:
+    """
+    Fingerprint of the scraped data the docs are loaded from, or None if there is none.
+
+    The corpus file is identified by its size and modification time; the page
+    files by their sorted names, count and latest modification time, so
+    deleted pages change it too.
+    """
+    if CORPUS_FILE.exists():
+        stat = CORPUS_FILE.stat()
+        return ("corpus", stat.st_size, stat.st_mtime_ns)
+    names = sorted(path.name for path in DOCS_DIR.glob("*.json") if path.name != "index.json")
+    if not names:
+        return None
+    latest = max((DOCS_DIR / name).stat().st_mtime_ns for name in names)
+    return ("pages", tuple(names), len(names), latest)
+
+
+class MappedTexts:
+    """
+    Read-only sequence of strings stored back to back as UTF-8 in a memory map.
+
+    String ``i`` is ``data[offsets[i]:offsets[i + 1]]``; recently decoded
+    strings are kept in a small LRU cache.
+    """
+
+    def __init__(self, data: mmap.mmap | bytes, offsets: np.ndarray):
+        self._data = data
+        self._offsets = offsets.tolist()
+        self._get = functools.lru_cache(maxsize=256)(self._decode)
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, i: int) -> str:
+        return self._get(i)
+
+    def encoded(self, i: int) -> bytes:
+        """String ``i`` as stored, without decoding it."""
+        return self._data[self._offsets[i]:self._offsets[i + 1]]
+
+    def _decode(self, i: int) -> str:
+        return self._data[self._offsets[i]:self._offsets[i + 1]].decode("utf-8")
+
+
+def _load_search_cache() -> tuple[list[dict], dict] | None:
+    """
+    The pickled docs and index, or None if missing, stale or unreadable.
+
+    The cache is stale when the scraped data's ``_source_signature`` differs
+    from the one it was built from, or when there is no scraped data left.
+    """
+    try:
+        source = _source_signature()
+        if source is None:
+            return None
+        with open(SEARCH_CACHE_FILE, "rb") as f:
+            cached = pickle.load(f)
+        if cached.get("version") != SEARCH_CACHE_VERSION or cached.get("source") != source:
+            return None
+
+        offsets = cached["text_offsets"]
+        with open(SEARCH_CACHE_CONTENTS_FILE, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size != offsets[-1]:
+                return None
+            # mmap can't map an empty file
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f"Error loading {SEARCH_CACHE_FILE}: {e}")
+        return None
+
+    # Original contents first, then the lowercased ones
+    n = len(cached["docs"])
+    index = cached["index"]
+    index["contents"] = MappedTexts(data, offsets[:n + 1])
+    index["contents_lower"] = MappedTexts(data, offsets[n:])
+    # Let each doc find its contents, for indexes built over other doc lists
+    for i, doc in enumerate(cached["docs"]):
+        doc["_mapped_content"] = (index["contents"], index["contents_lower"], i)
+    # Unpickled strings aren't interned; intern the lookup keys again
+    for key in ("token_ids", "title_token_ids", "title_exact"):
+        index[key] = {sys.intern(token): value for token, value in index[key].items()}
+    return cached["docs"], index
+
+
+def _save_search_cache(docs: list[dict], index: dict, source: tuple | None) -> bool:
+    """
+    Write the docs and index for the next start; returns whether it worked.
+
+    ``source`` is the ``_source_signature`` taken before the docs were
+    loaded. The contents file is written first, since the pickle is what
+    marks the cache as present.
+    """
+    if source is None:
+        return False
+
+    texts = [text.encode("utf-8") for text in (*index["contents"], *index["contents_lower"])]
+    text_offsets = np.zeros(len(texts) + 1, dtype=np.int64)
+    np.cumsum([len(text) for text in texts], out=text_offsets[1:])
+
+    metadata = [
+        {key: value for key, value in doc.items() if key not in ("content", "_content_lower", "_mapped_content")}
+        for doc in docs
+    ]
+    cached = {
+        "version": SEARCH_CACHE_VERSION,
+        "source": source,
+        "docs": metadata,
+        "index": {**index, "contents": None, "contents_lower": None, "term_hits": {}},
+        "text_offsets": text_offsets,
+    }
+
+    try:
+        tmp_path = SEARCH_CACHE_CONTENTS_FILE.with_name(SEARCH_CACHE_CONTENTS_FILE.name + ".tmp")
+        with open(tmp_path, "wb") as f:
+            f.writelines(texts)
+        os.replace(tmp_path, SEARCH_CACHE_CONTENTS_FILE)
+
+        tmp_path = SEARCH_CACHE_FILE.with_name(SEARCH_CACHE_FILE.name + ".tmp")
+        with open(tmp_path, "wb") as f:
+            pickle.dump(cached, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, SEARCH_CACHE_FILE)
+    except OSError as e:
+        print(f"Error saving {SEARCH_CACHE_FILE}: {e}")
+        return False
+    return True
+
+
 # Cache for loaded documentation
 _docs_cache: list[dict] | None = None
 
 
 def get_docs() -> list[dict]:
-    """Get cached documentation or load it."""
-    global _docs_cache
+    """
+    Get cached documentation or load it.
+
+    A fresh search cache is used when there is one; otherwise the docs are
+    loaded and indexed, and the cache is written for the next start. Either
+    way the cached docs hold only metadata: page contents are read from the
+    memory-mapped cache file when needed (``index["contents"]``).
+    """
+    global _docs_cache, _index_cache
     if _docs_cache is None:
-        _docs_cache = load_documentation()
+        cached = _load_search_cache() if DOCS_DIR.exists() else None
+        if cached is None:
+            # Taken before loading, so pages changed meanwhile invalidate the cache
+            source = _source_signature() if DOCS_DIR.exists() else None
+            docs = load_documentation()
+            index = build_index(docs)
+            # Reload through the cache so the contents don't stay in memory
+            if docs and _save_search_cache(docs, index, source):
+                cached = _load_search_cache()
+            if cached is None:
+                cached = (docs, index)
+        _docs_cache, index = cached
+        _index_cache = (_docs_cache, index)
+        # Memoized answers refer to the previous documentation
+        _search_alias_docs_cached.cache_clear()
     return _docs_cache
 
 
@@ -60,6 +289,288 @@ def get_docs() -> list[dict]:
 # Search helpers
 # ---------------------------------------------------------------------------
 
+# Words as indexed: runs of these characters in the lowercased text
+TOKEN_RE = re.compile(r"[a-z0-9_:]+")
+
+# Query terms whose hits each index keeps before starting over
+TERM_CACHE_SIZE = 1024
+
+
+def build_index(docs: list[dict]) -> dict:
+    """
+    Build an inverted index over the titles and contents of ``docs``.
+
+    The postings are stored in CSR form: ``token_ids`` numbers the content
+    tokens, and token ``t`` occurs in the docs at positions
+    ``doc_ids[offsets[t]:offsets[t + 1]]`` with the matching counts in ``tfs``.
+    Title tokens are numbered the same way in ``title_token_ids``, with
+    ``title_offsets`` into ``title_doc_ids``.
+    ``title_exact`` maps each lowercased title to its doc positions and
+    ``title_trigrams`` maps every three-character window of a lowercased
+    title to the positions of the docs whose title contains it. The
+    vocabularies are also kept as newline-joined strings so the tokens
+    containing a query term can be found with a single regex scan.
+
+    ``class_docs`` and ``guide_docs`` list the positions of the class
+    reference pages (titles starting with "Al") and of the other pages,
+    ordered by title, for ``list_available_docs``.
+
+    ``term_hits`` starts empty and memoizes ``_term_hits`` per query term.
+
+    The fields the scoring loop reads are copied into parallel lists
+    (``titles_lower``, ``contents``, ``contents_lower``, ``has_code``) indexed
+    by doc position, so it doesn't go through the doc dicts. For the cached
+    documentation the contents are ``MappedTexts`` read from disk.
+    """
+    postings: dict[str, list[tuple[int, int]]] = {}
+    title_postings: dict[str, list[int]] = {}
+    title_exact: dict[str, list[int]] = {}
+    title_trigrams: dict[str, set[int]] = {}
+
+    # Docs that didn't go through _add_search_fields are lowercased here
+    titles_lower = [doc.get("_title_lower") or doc.get("title", "").lower() for doc in docs]
+    texts = [_doc_texts(doc) for doc in docs]
+    contents = [content for content, _ in texts]
+    contents_lower = [content_lower for _, content_lower in texts]
+    has_code = [bool(doc.get("has_code_blocks")) for doc in docs]
+
+    for i, (title_lower, content_lower) in enumerate(zip(titles_lower, contents_lower)):
+        for token, count in Counter(TOKEN_RE.findall(content_lower)).items():
+            postings.setdefault(sys.intern(token), []).append((i, count))
+        for token in set(TOKEN_RE.findall(title_lower)):
+            title_postings.setdefault(sys.intern(token), []).append(i)
+        title_exact.setdefault(title_lower, []).append(i)
+        for start in range(len(title_lower) - 2):
+            title_trigrams.setdefault(title_lower[start:start + 3], set()).add(i)
+
+    offsets = _csr_offsets(postings)
+    nnz = int(offsets[-1])
+    doc_ids = np.fromiter((i for pairs in postings.values() for i, _ in pairs), dtype=np.int32, count=nnz)
+    tfs = np.fromiter((count for pairs in postings.values() for _, count in pairs), dtype=np.int64, count=nnz)
+
+    titles = [doc.get("title", "") for doc in docs]
+    class_docs = []
+    guide_docs = []
+    for i in sorted(range(len(docs)), key=titles.__getitem__):
+        (class_docs if titles[i].startswith("Al") else guide_docs).append(i)
+
+    title_offsets = _csr_offsets(title_postings)
+    title_doc_ids = np.fromiter(
+        (i for ids in title_postings.values() for i in ids), dtype=np.int32, count=int(title_offsets[-1])
+    )
+
+    return {
+        "token_ids": {token: t for t, token in enumerate(postings)},
+        "offsets": offsets,
+        "doc_ids": doc_ids,
+        "tfs": tfs,
+        "title_token_ids": {token: t for t, token in enumerate(title_postings)},
+        "title_offsets": title_offsets,
+        "title_doc_ids": title_doc_ids,
+        "title_exact": title_exact,
+        "title_trigrams": title_trigrams,
+        "vocab": "\n".join(postings),
+        "title_vocab": "\n".join(title_postings),
+        "titles_lower": titles_lower,
+        "contents": contents,
+        "contents_lower": contents_lower,
+        "has_code": np.array(has_code, dtype=bool),
+        "class_docs": class_docs,
+        "guide_docs": guide_docs,
+        "term_hits": {},
+    }
+
+
+def _doc_texts(doc: dict) -> tuple[str, str]:
+    """
+    A doc's content and lowercased content.
+
+    Docs loaded from the search cache hold only metadata; their contents are
+    read from the memory-mapped cache file (``_mapped_content``).
+    """
+    mapped = doc.get("_mapped_content")
+    if mapped is not None and "content" not in doc:
+        contents, contents_lower, i = mapped
+        return contents[i], contents_lower[i]
+    content = doc.get("content", "")
+    return content, doc.get("_content_lower") or content.lower()
+
+
+def _csr_offsets(postings: dict[str, list]) -> np.ndarray:
+    """Start of each token's postings in the flattened arrays, plus the total length."""
+    offsets = np.zeros(len(postings) + 1, dtype=np.int64)
+    np.cumsum([len(entries) for entries in postings.values()], out=offsets[1:])
+    return offsets
+
+
+def _postings(tokens: list[str], token_ids: dict[str, int], offsets: np.ndarray) -> list[slice]:
+    """Slices of the flattened postings arrays holding the postings of ``tokens``."""
+    spans = []
+    for token in tokens:
+        t = token_ids[token]
+        spans.append(slice(offsets[t], offsets[t + 1]))
+    return spans
+
+
+def _title_docs(tokens: list[str], index: dict) -> np.ndarray:
+    """Sorted positions of the docs whose titles contain any of ``tokens``."""
+    title_doc_ids = index["title_doc_ids"]
+    spans = _postings(tokens, index["title_token_ids"], index["title_offsets"])
+    if not spans:
+        return np.empty(0, dtype=np.int32)
+    return np.unique(np.concatenate([title_doc_ids[span] for span in spans]))
+
+
+def _content_docs(tokens: list[str], index: dict) -> np.ndarray:
+    """Sorted positions of the docs whose contents contain any of ``tokens``."""
+    doc_ids = index["doc_ids"]
+    spans = _postings(tokens, index["token_ids"], index["offsets"])
+    if not spans:
+        return np.empty(0, dtype=np.int32)
+    return np.unique(np.concatenate([doc_ids[span] for span in spans]))
+
+
+# Index for the cached documentation, rebuilt if a different list is searched
+_index_cache: tuple[list[dict], dict] | None = None
+
+
+def get_index(docs: list[dict]) -> dict:
+    """Get the cached inverted index for ``docs`` or build it."""
+    global _index_cache
+    if _index_cache is None or _index_cache[0] is not docs:
+        _index_cache = (docs, build_index(docs))
+    return _index_cache[1]
+
+
+def _tokens_containing(piece: str, vocab: str) -> list[str]:
+    """Tokens of a newline-joined vocabulary that contain ``piece`` (token characters only)."""
+    return re.findall(f"[a-z0-9_:]*{re.escape(piece)}[a-z0-9_:]*", vocab)
+
+
+def _tokens_containing_any(pieces: list[str], vocab: str) -> dict[str, list[str]]:
+    """``_tokens_containing`` for several pieces, with a single scan of the vocabulary."""
+    pattern = "|".join(map(re.escape, pieces))
+    tokens = re.findall(f"[a-z0-9_:]*(?:{pattern})[a-z0-9_:]*", vocab)
+    return {piece: [token for token in tokens if piece in token] for piece in pieces}
+
+
+def _term_hits(term: str, index: dict) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Find the docs whose title contains ``term`` and how often it occurs in each content.
+
+    Returns the positions of the title hits (ascending), and the positions of the docs
+    whose content contains ``term`` (ascending) with the matching counts.
+
+    Results are memoized in the index, so callers must not mutate them.
+    """
+    cache = index["term_hits"]
+    hits = cache.get(term)
+    if hits is None:
+        if len(cache) >= TERM_CACHE_SIZE:
+            cache.clear()
+        hits = cache[term] = _collect_term_hits(term, index)
+    return hits
+
+
+def _prefetch_term_hits(terms: list[str], index: dict) -> None:
+    """
+    Memoize the hits of a query's new terms, scanning each vocabulary once for all of them.
+
+    Only terms made of token characters are prefetched; a single new term is
+    left to ``_term_hits``.
+    """
+    cache = index["term_hits"]
+    missing = [term for term in dict.fromkeys(terms) if term not in cache and TOKEN_RE.fullmatch(term)]
+    if len(missing) < 2:
+        return
+
+    title_tokens = _tokens_containing_any(missing, index["title_vocab"])
+    tokens = _tokens_containing_any(missing, index["vocab"])
+    if len(cache) + len(missing) > TERM_CACHE_SIZE:
+        cache.clear()
+    for term in missing:
+        cache[term] = _collect_term_hits(term, index, title_tokens[term], tokens[term])
+
+
+def _collect_term_hits(
+    term: str, index: dict, title_tokens: list[str] | None = None, tokens: list[str] | None = None
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Uncached ``_term_hits``.
+
+    ``title_tokens`` and ``tokens`` are the vocabulary tokens containing
+    ``term``, if the caller already found them.
+
+    A term made only of token characters can't straddle a token boundary, so its
+    substring count in a document is the sum, over the document's tokens that
+    contain it, of the token's count times the occurrences of the term in the
+    token. Other terms (e.g. "plug-in") are counted directly, but only in the
+    documents that have a token containing each of the term's word pieces.
+    """
+    if not TOKEN_RE.fullmatch(term):
+        return _scan_term_hits(term, index)
+
+    if title_tokens is None:
+        title_tokens = _tokens_containing(term, index["title_vocab"])
+    title_hits = _title_docs(title_tokens, index)
+
+    # Scatter the postings of every token containing the term into per-doc counts
+    if tokens is None:
+        tokens = _tokens_containing(term, index["vocab"])
+    spans = _postings(tokens, index["token_ids"], index["offsets"])
+    if not spans:
+        return title_hits, np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+
+    doc_ids = index["doc_ids"]
+    tfs = index["tfs"]
+    totals = np.bincount(
+        np.concatenate([doc_ids[span] for span in spans]),
+        np.concatenate([tfs[span] * token.count(term) for token, span in zip(tokens, spans)]),
+        minlength=len(index["has_code"]),
+    )
+    content_hits = np.flatnonzero(totals)
+    return title_hits, content_hits, totals[content_hits].astype(np.int64)
+
+
+def _scan_term_hits(term: str, index: dict) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """``_term_hits`` for terms with non-token characters, by substring search of candidate docs."""
+    titles_lower = index["titles_lower"]
+    contents_lower = index["contents_lower"]
+
+    pieces = TOKEN_RE.findall(term)
+    if not pieces:
+        # Nothing to narrow by (e.g. "()"): every document is a candidate
+        title_candidates = content_candidates = range(len(titles_lower))
+    else:
+        title_candidates = functools.reduce(np.intersect1d, (
+            _title_docs(_tokens_containing(piece, index["title_vocab"]), index) for piece in pieces
+        )).tolist()
+        content_candidates = functools.reduce(np.intersect1d, (
+            _content_docs(_tokens_containing(piece, index["vocab"]), index) for piece in pieces
+        )).tolist()
+
+    if isinstance(contents_lower, MappedTexts):
+        # Count in the stored UTF-8 instead of decoding each page: UTF-8 is
+        # self-synchronizing, so the byte matches are exactly the str matches
+        texts, needle = contents_lower.encoded, term.encode("utf-8")
+    else:
+        texts, needle = contents_lower.__getitem__, term
+
+    title_hits = [i for i in title_candidates if term in titles_lower[i]]
+    content_hits = []
+    counts = []
+    for i in content_candidates:
+        count = texts(i).count(needle)
+        if count:
+            content_hits.append(i)
+            counts.append(count)
+    return (
+        np.array(title_hits, dtype=np.int64),
+        np.array(content_hits, dtype=np.int64),
+        np.array(counts, dtype=np.int64),
+    )
+
+
 def search_docs(query: str, docs: list[dict], max_results: int = 5) -> list[dict]:
     """
     Keyword-based search over documentation with relevance scoring.
@@ -69,70 +580,121 @@ def search_docs(query: str, docs: list[dict], max_results: int = 5) -> list[dict
       - Query term in title: +10 per term
       - Query term in content: +1 per occurrence
       - Bonus for pages with code blocks when query looks code-related
+
+    Scores come from the inverted index (see ``build_index``), so only the
+    documents that match the query are touched, and snippets are only
+    extracted for the documents that make the top ``max_results``.
     """
     query_lower = query.lower()
-    query_terms = query_lower.split()
+    query_terms = [sys.intern(term) for term in query_lower.split()]
 
     # Heuristic: boost code pages when query looks like a class/method name
-    code_query = bool(re.match(r"^Al[A-Z]", query)) or "::" in query
+    code_query = (len(query) > 2 and query.startswith("Al") and "A" <= query[2] <= "Z") or "::" in query
+
+    index = get_index(docs)
+    scores = np.zeros(len(docs), dtype=np.int64)
+
+    # Exact title match (case-insensitive)
+    scores[index["title_exact"].get(query_lower, [])] = 50
 
+    _prefetch_term_hits(query_terms, index)
+    term_hits = [(term, *_term_hits(term, index)) for term in query_terms]
+    for _, title_hits, content_hits, counts in term_hits:
+        scores[title_hits] += 10
+        # Content hit positions are unique, so the fancy-index add is safe
+        scores[content_hits] += counts
+
+    # Every doc the query touched (all scores are positive); in document
+    # order, so ties keep their order in the top-K selection
+    candidates = np.flatnonzero(scores)
+
+    # Boost pages with code when query looks code-related
+    if code_query:
+        boosted = candidates[index["has_code"][candidates]]
+        scores[boosted] = (scores[boosted] * 1.2).astype(np.int64)
+
+    candidates = candidates.tolist()
+    candidate_scores = scores[candidates].tolist()
+    top = heapq.nlargest(max_results, range(len(candidates)), key=candidate_scores.__getitem__)
+
+    contents = index["contents"]
+    contents_lower = index["contents_lower"]
     results = []
+    for rank in top:
+        i = candidates[rank]
+        doc = docs[i]
+        snippet = extract_snippet(contents[i], query_terms, content_lower=contents_lower[i])
+        results.append({
+            "guid": doc.get("guid"),
+            "title": doc.get("title", ""),
+            "url": doc.get("url"),
+            "score": candidate_scores[rank],
+            "matched_terms": _matched_terms(i, term_hits),
+            "has_code": doc.get("has_code_blocks", False),
+            "snippet": snippet,
+        })
+
+    return results
+
+
+def _contains(positions: np.ndarray, i: int) -> bool:
+    """Whether the sorted array ``positions`` contains ``i``."""
+    k = np.searchsorted(positions, i)
+    return k < len(positions) and positions[k] == i
+
+
+def _matched_terms(i: int, term_hits: list[tuple]) -> list[str]:
+    """
+    The query terms doc ``i`` matched, in query order.
 
-    for doc in docs:
-        title = doc.get("title", "")
-        title_lower = title.lower()
-        content = doc.get("content", "")
-        content_lower = content.lower()
+    A term is listed once per title hit (so a repeated term shows up for each
+    repetition), and once if only its content matched.
+    """
+    matched = []
+    for term, title_hits, content_hits, _ in term_hits:
+        if _contains(title_hits, i):
+            matched.append(term)
+        elif term not in matched and _contains(content_hits, i):
+            matched.append(term)
+    return matched
+
+
+@functools.lru_cache(maxsize=256)
+def _terms_pattern(query_terms: tuple[str, ...]) -> re.Pattern:
+    """Alternation regex matching any of the query terms, compiled once per query."""
+    return re.compile("|".join(map(re.escape, query_terms)))
+
+
+def _first_term_pos(content_lower: str, query_terms: list[str]) -> int:
+    """
+    Position of the earliest occurrence of any query term, or -1.
+
+    Several terms are matched with one alternation regex, so the content is
+    scanned once instead of once per term.
+    """
+    if not query_terms:
+        return -1
+    if len(query_terms) == 1:
+        return content_lower.find(query_terms[0])
+    match = _terms_pattern(tuple(query_terms)).search(content_lower)
+    return match.start() if match else -1
 
-        score = 0
-        matched_terms = []
-
-        # Exact title match (case-insensitive)
-        if query_lower == title_lower:
-            score += 50
-
-        for term in query_terms:
-            if term in title_lower:
-                score += 10
-                matched_terms.append(term)
-            count = content_lower.count(term)
-            if count > 0:
-                score += count
-                if term not in matched_terms:
-                    matched_terms.append(term)
-
-        # Boost pages with code when query looks code-related
-        if code_query and doc.get("has_code_blocks"):
-            score = int(score * 1.2)
-
-        if score > 0:
-            snippet = extract_snippet(content, query_terms)
-            results.append({
-                "guid": doc.get("guid"),
-                "title": title,
-                "url": doc.get("url"),
-                "score": score,
-                "matched_terms": matched_terms,
-                "has_code": doc.get("has_code_blocks", False),
-                "snippet": snippet,
-            })
-
-    results.sort(key=lambda x: x["score"], reverse=True)
-    return results[:max_results]
-
-
-def extract_snippet(content: str, query_terms: list[str], snippet_length: int = 500) -> str:
-    """Extract a relevant snippet from the content containing query terms."""
-    content_lower = content.lower()
+
+def extract_snippet(
+    content: str, query_terms: list[str], snippet_length: int = 500, content_lower: str | None = None
+) -> str:
+    """
+    Extract a relevant snippet from the content containing query terms.
+
+    ``content_lower`` is the precomputed lowercased content, if the caller has it.
+    """
+    if content_lower is None:
+        content_lower = content.lower()
 
     # Find the first occurrence of any query term
-    best_pos = len(content)
-    for term in query_terms:
-        pos = content_lower.find(term)
-        if pos != -1 and pos < best_pos:
-            best_pos = pos
+    best_pos = _first_term_pos(content_lower, query_terms)
 
-    if best_pos == len(content):
+    if best_pos == -1 or best_pos >= len(content):
         # No positional match - return the beginning
         return content[:snippet_length] + ("..." if len(content) > snippet_length else "")
 
@@ -166,27 +728,38 @@ def search_alias_docs(query: str, max_results: int = 5) -> str:
     Returns:
         Matching documentation snippets with titles and links.
     """
+    return _search_alias_docs_cached(query, max_results)
+
+
+@functools.lru_cache(maxsize=512)
+def _search_alias_docs_cached(query: str, max_results: int) -> str:
+    """``search_alias_docs`` output for the cached documentation, memoized for repeated queries."""
     docs = get_docs()
 
     if not docs:
-        return "No documentation available. Ensure data/docs_tavily/ contains scraped JSON files."
+        return (
+            "No documentation available. Ensure data/docs_tavily/clean/ contains scraped JSON files "
+            f"(pages saved by an older scraper version can be moved there with `{MIGRATE_COMMAND}`)."
+        )
 
     results = search_docs(query, docs, max_results)
 
     if not results:
         return f"No results found for: {query}"
 
-    output = f"Found {len(results)} results for: {query}\n\n"
+    parts = [f"Found {len(results)} results for: {query}\n\n"]
 
     for i, result in enumerate(results, 1):
         code_tag = " 📝" if result["has_code"] else ""
-        output += f"## {i}. {result['title']}{code_tag}\n"
-        output += f"**URL:** {result['url']}\n"
-        output += f"**Matched terms:** {', '.join(result['matched_terms'])}\n"
-        output += f"\n{result['snippet']}\n\n"
-        output += "---\n\n"
+        parts.append(
+            f"## {i}. {result['title']}{code_tag}\n"
+            f"**URL:** {result['url']}\n"
+            f"**Matched terms:** {', '.join(result['matched_terms'])}\n"
+            f"\n{result['snippet']}\n\n"
+            "---\n\n"
+        )
 
-    return output
+    return "".join(parts)
 
 
 @mcp.tool()
@@ -200,32 +773,26 @@ def list_available_docs() -> str:
     docs = get_docs()
 
     if not docs:
-        return "No documentation available. Ensure data/docs_tavily/ contains scraped JSON files."
+        return (
+            "No documentation available. Ensure data/docs_tavily/clean/ contains scraped JSON files "
+            f"(pages saved by an older scraper version can be moved there with `{MIGRATE_COMMAND}`)."
+        )
 
-    # Group by type
-    class_docs = []
-    guide_docs = []
-
-    for doc in sorted(docs, key=lambda x: x.get("title", "")):
-        title = doc.get("title", "")
-        if title.startswith("Al"):
-            class_docs.append(doc)
-        else:
-            guide_docs.append(doc)
+    # Grouped by type when the index was built
+    index = get_index(docs)
+    class_docs = index["class_docs"]
+    guide_docs = index["guide_docs"]
+    has_code = index["has_code"].tolist()
 
-    output = f"Available documentation pages ({len(docs)} total):\n\n"
+    parts = [f"Available documentation pages ({len(docs)} total):\n\n"]
 
-    output += f"### Class Reference ({len(class_docs)} classes)\n"
-    for doc in class_docs:
-        code_tag = " 📝" if doc.get("has_code_blocks") else ""
-        output += f"- **{doc.get('title')}**{code_tag}\n"
+    parts.append(f"### Class Reference ({len(class_docs)} classes)\n")
+    parts.extend(f"- **{docs[i].get('title')}**{' 📝' if has_code[i] else ''}\n" for i in class_docs)
 
-    output += f"\n### Guides & Concepts ({len(guide_docs)} pages)\n"
-    for doc in guide_docs:
-        code_tag = " 📝" if doc.get("has_code_blocks") else ""
-        output += f"- **{doc.get('title')}**{code_tag}\n"
+    parts.append(f"\n### Guides & Concepts ({len(guide_docs)} pages)\n")
+    parts.extend(f"- **{docs[i].get('title')}**{' 📝' if has_code[i] else ''}\n" for i in guide_docs)
 
-    return output
+    return "".join(parts)
 
 
 @mcp.tool()
@@ -240,29 +807,53 @@ def get_doc_by_title(title: str) -> str:
         The full content of the matching documentation page.
     """
     docs = get_docs()
+    index = get_index(docs)
     title_lower = title.lower()
 
     # Try exact match first, then partial
-    for doc in docs:
-        if title_lower == doc.get("title", "").lower():
-            return _format_doc(doc)
+    exact = index["title_exact"].get(title_lower)
+    if exact:
+        return _format_doc(docs[exact[0]], index["contents"][exact[0]])
 
-    for doc in docs:
-        if title_lower in doc.get("title", "").lower():
-            return _format_doc(doc)
+    i = _find_title_containing(title_lower, index)
+    if i is not None:
+        return _format_doc(docs[i], index["contents"][i])
 
     return f"No documentation found matching: {title}"
 
 
-def _format_doc(doc: dict) -> str:
-    """Format a document for output."""
-    output = f"# {doc.get('title')}\n\n"
-    output += f"**URL:** {doc.get('url')}\n"
+def _find_title_containing(title_lower: str, index: dict) -> int | None:
+    """
+    Position of the first doc whose lowercased title contains ``title_lower``.
+
+    Only the docs whose titles share every trigram of ``title_lower`` are
+    checked; shorter queries scan all the titles.
+    """
+    titles_lower = index["titles_lower"]
+
+    if len(title_lower) < 3:
+        candidates = range(len(titles_lower))
+    else:
+        title_trigrams = index["title_trigrams"]
+        trigrams = {title_lower[start:start + 3] for start in range(len(title_lower) - 2)}
+        if not trigrams <= title_trigrams.keys():
+            return None
+        candidates = sorted(set.intersection(*(title_trigrams[t] for t in trigrams)))
+
+    for i in candidates:
+        if title_lower in titles_lower[i]:
+            return i
+    return None
+
+
+def _format_doc(doc: dict, content: str) -> str:
+    """Format a document and its content (read separately, see ``get_docs``) for output."""
+    parts = [f"# {doc.get('title')}\n\n", f"**URL:** {doc.get('url')}\n"]
     if doc.get("has_code_blocks"):
-        output += "**Contains code examples:** Yes\n"
-    output += "\n"
-    output += doc.get("content", "No content available.")
-    return output
+        parts.append("**Contains code examples:** Yes\n")
+    parts.append("\n")
+    parts.append(content or "No content available.")
+    return "".join(parts)
 
 
 # ---------------------------------------------------------------------------
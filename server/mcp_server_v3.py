@@ -15,23 +15,44 @@ Improvements over V2:
   - MCP Resource for documentation index
   - Actionable error messages with recovery hints
 
-Data source: data/docs_tavily/
+Data source: data/docs_tavily/clean/
 """
 
+import difflib
+import functools
+import gzip
+import heapq
 import json
+import logging
+import math
+import os
 import re
+import sys
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 from enum import Enum
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional
 
+import numpy as np
+import orjson
 from pydantic import BaseModel, Field, ConfigDict, field_validator
 from mcp.server.fastmcp import FastMCP, Context
-from rank_bm25 import BM25Okapi
 
 
-# Path to Tavily-scraped documentation
-DOCS_DIR = Path(__file__).parent.parent / "data" / "docs_tavily"
+log = logging.getLogger("mcp.alias_docs")
+
+# Path to Tavily-scraped documentation (the cleaned copies, without raw_content)
+DOCS_DIR = Path(__file__).parent.parent / "data" / "docs_tavily" / "clean"
+
+# All pages in one gzipped JSON-lines file, written by the Tavily scraper
+CORPUS_FILE = DOCS_DIR / "corpus.jsonl.gz"
+
+# Older scraper versions saved each page (with raw_content) directly here;
+# read when clean/ doesn't exist yet, until the files are migrated
+LEGACY_DOCS_DIR = DOCS_DIR.parent
+MIGRATE_COMMAND = "python scraper_tavily/tavily_scraper.py --migrate"
 
 
 # ---------------------------------------------------------------------------
@@ -81,6 +102,42 @@ class SearchInput(BaseModel):
         return v.strip()
 
 
+class SearchBatchInput(BaseModel):
+    """Input model for running several documentation searches in one call."""
+
+    model_config = ConfigDict(str_strip_whitespace=True)
+
+    queries: list[str] = Field(
+        ...,
+        description=(
+            "Search queries, each like a search_alias_docs query "
+            "(e.g. ['AlCurve', 'create NURBS surface'])"
+        ),
+        min_length=1,
+        max_length=20,
+    )
+    max_results: int = Field(
+        default=5,
+        description="Maximum number of results to return per query (1–20)",
+        ge=1,
+        le=20,
+    )
+    response_format: ResponseFormat = Field(
+        default=ResponseFormat.MARKDOWN,
+        description="Output format: 'markdown' (human-readable) or 'json' (machine-readable)",
+    )
+
+    @field_validator("queries")
+    @classmethod
+    def validate_queries(cls, v: list[str]) -> list[str]:
+        queries = [q.strip() for q in v]
+        if not all(queries):
+            raise ValueError("Queries cannot be empty or whitespace only")
+        if any(len(q) > 500 for q in queries):
+            raise ValueError("Queries can be at most 500 characters long")
+        return queries
+
+
 class GetDocInput(BaseModel):
     """Input model for retrieving a single doc page by title."""
 
@@ -176,60 +233,312 @@ class CodeExamplesInput(BaseModel):
 # Data loading
 # ---------------------------------------------------------------------------
 
+# Page fields the server reads; everything else is dropped at load time
+DOC_FIELDS = ("title", "guid", "url", "content", "has_code_blocks")
+
+# Short fields that are repeated in the lifespan's lookup tables
+INTERNED_FIELDS = ("title", "guid", "url")
+
+
+def _slim_doc(doc: dict) -> dict:
+    """Keep only ``DOC_FIELDS`` of a loaded page, with its short strings interned."""
+    slim = {key: doc[key] for key in DOC_FIELDS if key in doc}
+    for key in INTERNED_FIELDS:
+        if isinstance(slim.get(key), str):
+            slim[key] = sys.intern(slim[key])
+    return slim
+
+
+def _add_search_fields(doc: dict) -> dict:
+    """Lowercase a doc's title and content once at load time, for every search to reuse."""
+    doc["_title_lower"] = sys.intern(doc.get("title", "").lower())
+    doc["_content_lower"] = doc.get("content", "").lower()
+    return doc
+
+
 def load_documentation() -> list[dict]:
     """
-    Load all scraped documentation from JSON files.
+    Load all scraped documentation.
+
+    Reads the consolidated corpus.jsonl.gz in one go when it exists, falling
+    back to the per-page JSON files. Without a clean/ directory, page files
+    left in data/docs_tavily/ by older scraper versions are read instead.
 
-    Memory optimization: ``raw_content`` is stripped during loading because
-    it duplicates ``content`` in a larger, uncleaned form (HTML with nav/
+    Memory optimization: only ``DOC_FIELDS`` are kept (see ``_slim_doc``).
+    In particular ``raw_content`` is stripped during loading because it
+    duplicates ``content`` in a larger, uncleaned form (HTML with nav/
     footer junk).  This typically saves 5-20 MB across all docs.
     """
     docs = []
 
     if not DOCS_DIR.exists():
+        json_files = list(LEGACY_DOCS_DIR.glob("GUID-*.json"))
+        if json_files:
+            log.warning(
+                "Reading %d legacy page files from %s; run `%s` to move them into %s",
+                len(json_files), LEGACY_DOCS_DIR, MIGRATE_COMMAND, DOCS_DIR,
+            )
+        return _load_doc_files(json_files)
+
+    if CORPUS_FILE.exists():
+        try:
+            with gzip.open(CORPUS_FILE, "rb") as f:
+                for line_no, line in enumerate(f, 1):
+                    if not line.strip():
+                        continue
+                    try:
+                        docs.append(_add_search_fields(_slim_doc(orjson.loads(line))))
+                    except Exception as e:
+                        log.warning("Error loading %s line %d: %s", CORPUS_FILE, line_no, e)
+        except (EOFError, gzip.BadGzipFile) as e:
+            log.warning("Error loading %s: %s", CORPUS_FILE, e)
         return docs
 
-    for json_file in DOCS_DIR.glob("*.json"):
-        if json_file.name == "index.json":
-            continue
-        try:
-            with open(json_file, "r", encoding="utf-8") as f:
-                doc = json.load(f)
-                # Drop raw_content to save memory — content is the cleaned version
-                doc.pop("raw_content", None)
-                docs.append(doc)
-        except Exception as e:
-            print(f"Error loading {json_file}: {e}")
+    json_files = [path for path in DOCS_DIR.glob("*.json") if path.name != "index.json"]
+    return _load_doc_files(json_files)
+
+
+def _load_doc_files(json_files: list[Path]) -> list[dict]:
+    """Read and parse one small file per page on a thread pool."""
+    docs = []
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as pool:
+        for doc in pool.map(_load_doc_file, json_files):
+            if doc is not None:
+                docs.append(_add_search_fields(doc))
 
     return docs
 
 
+def _load_doc_file(json_file: Path) -> dict | None:
+    """Parse one page file (see ``_slim_doc``), or return None if it can't be read."""
+    try:
+        return _slim_doc(orjson.loads(json_file.read_bytes()))
+    except Exception as e:
+        log.warning("Error loading %s: %s", json_file, e)
+        return None
+
+
 # ---------------------------------------------------------------------------
 # BM25 helpers
 # ---------------------------------------------------------------------------
 
+# Byte table for _tokenize: ASCII letters and digits are kept, every other byte becomes a space
+_TOKEN_BYTES = frozenset(b"abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789")
+_SPLIT_TABLE = bytes(c if c in _TOKEN_BYTES else 0x20 for c in range(256))
+
+
 def _tokenize(text: str) -> list[str]:
-    """Simple tokenizer: lowercase, split on non-alphanumeric, drop short tokens."""
-    tokens = re.split(r"[^a-zA-Z0-9]+", text.lower())
-    return [t for t in tokens if len(t) >= 2]
+    """
+    Simple tokenizer: lowercase, split on non-alphanumeric, drop short tokens.
+
+    Tokens are the runs of ASCII letters and digits, as with splitting on
+    ``[^a-zA-Z0-9]+``. The split is done with one C-level byte translation:
+    non-ASCII characters are encoded as "?" and, like all other separators,
+    translated to spaces.
+    """
+    text = text.lower().encode("ascii", "replace").translate(_SPLIT_TABLE).decode("ascii")
+    return [t for t in text.split() if len(t) >= 2]
+
+
+@functools.lru_cache(maxsize=1024)
+def _tokenize_query(query: str) -> tuple[str, ...]:
+    """``_tokenize`` for search queries, memoized; the corpus is tokenized with ``_tokenize`` directly."""
+    return tuple(_tokenize(query))
+
+
+class SparseBM25:
+    """
+    Okapi BM25 scorer over an inverted index.
+
+    Gives the same scores as ``rank_bm25.BM25Okapi`` (same k1, b and epsilon
+    handling of negative IDFs), but a query only touches the documents that
+    contain one of its tokens instead of the whole corpus.
 
+    Postings are stored in CSR form: token ``t`` (numbered by ``token_ids``)
+    occurs in the documents ``doc_ids[offsets[t]:offsets[t + 1]]`` with the
+    matching term frequencies in ``tfs``. The per-document length
+    normalization ``k1 * (1 - b + b * dl / avgdl)`` is computed once.
 
-def _build_bm25_index(docs: list[dict]) -> tuple[BM25Okapi, list[list[str]]]:
+    ``corpus`` is consumed once, so it can be a generator that tokenizes
+    each document on demand; the token lists aren't kept.
+    """
+
+    def __init__(self, corpus: Iterable[list[str]], k1: float = 1.5, b: float = 0.75, epsilon: float = 0.25):
+        self.k1 = k1
+        self.b = b
+
+        postings: dict[str, list[tuple[int, int]]] = {}
+        lengths = []
+        for i, tokens in enumerate(corpus):
+            lengths.append(len(tokens))
+            for token, freq in Counter(tokens).items():
+                postings.setdefault(token, []).append((i, freq))
+        self.corpus_size = len(lengths)
+        doc_len = np.array(lengths, dtype=np.int64)
+
+        self.token_ids = {token: t for t, token in enumerate(postings)}
+        self.offsets = np.zeros(len(postings) + 1, dtype=np.int64)
+        np.cumsum([len(pairs) for pairs in postings.values()], out=self.offsets[1:])
+        nnz = int(self.offsets[-1])
+        # 32-bit postings halve the memory a query streams through; the
+        # weights are still computed in float64
+        self.doc_ids = np.fromiter((i for pairs in postings.values() for i, _ in pairs), dtype=np.int32, count=nnz)
+        self.tfs = np.fromiter((freq for pairs in postings.values() for _, freq in pairs), dtype=np.int32, count=nnz)
+
+        # IDF as in BM25Okapi: negative values are replaced by epsilon times the average
+        idf = []
+        idf_sum = 0.0
+        for pairs in postings.values():
+            n = len(pairs)
+            idf.append(math.log(self.corpus_size - n + 0.5) - math.log(n + 0.5))
+            idf_sum += idf[-1]
+        average_idf = idf_sum / len(idf) if idf else 0.0
+        self.idf = np.array([value if value >= 0 else epsilon * average_idf for value in idf], dtype=np.float64)
+
+        avgdl = int(doc_len.sum()) / self.corpus_size if self.corpus_size else 0.0
+        self.doc_len_norm = k1 * (1 - b + b * doc_len / avgdl) if avgdl else np.full(self.corpus_size, k1 * (1 - b))
+
+    def get_scores(self, query: Iterable[str]) -> np.ndarray:
+        """BM25 score of every document for the query tokens (repeated tokens count again)."""
+        scores = np.zeros(self.corpus_size)
+        for token in query:
+            t = self.token_ids.get(token)
+            if t is None:
+                continue
+            span = slice(self.offsets[t], self.offsets[t + 1])
+            docs = self.doc_ids[span]
+            tf = self.tfs[span]
+            scores[docs] += self.idf[t] * (tf * (self.k1 + 1) / (tf + self.doc_len_norm[docs]))
+        return scores
+
+    def get_batch_scores(self, queries: list[Iterable[str]]) -> np.ndarray:
+        """
+        ``get_scores`` for several queries, one row per query.
+
+        The per-document weights of a token are computed once for the whole
+        batch, however many queries contain it.
+        """
+        scores = np.zeros((len(queries), self.corpus_size))
+        weights: dict[int, tuple[np.ndarray, np.ndarray]] = {}
+        for row, query in zip(scores, queries):
+            for token in query:
+                t = self.token_ids.get(token)
+                if t is None:
+                    continue
+                if t not in weights:
+                    span = slice(self.offsets[t], self.offsets[t + 1])
+                    docs = self.doc_ids[span]
+                    tf = self.tfs[span]
+                    weights[t] = docs, self.idf[t] * (tf * (self.k1 + 1) / (tf + self.doc_len_norm[docs]))
+                docs, weight = weights[t]
+                row[docs] += weight
+        return scores
+
+
+def _build_bm25_index(docs: list[dict]) -> SparseBM25:
     """Build a BM25 index over all document content (title + content)."""
-    corpus = []
-    for doc in docs:
-        # Combine title (repeated for extra weight) and content
-        title = doc.get("title", "")
-        content = doc.get("content", "")
-        text = f"{title} {title} {title} {content}"
-        corpus.append(_tokenize(text))
-    return BM25Okapi(corpus), corpus
+    def corpus():
+        for doc in docs:
+            # Combine title (repeated for extra weight) and content
+            title = doc.get("title", "")
+            content = doc.get("content", "")
+            yield _tokenize(f"{title} {title} {title} {content}")
+
+    return SparseBM25(corpus())
+
+
+# Title words for the title-term lookup: runs of these characters in the lowercased title
+TITLE_TOKEN_RE = re.compile(r"[a-z0-9_:]+")
+
+
+def _build_search_tables(docs: list[dict]) -> dict:
+    """
+    Per-document fields the search boosts read, laid out by doc position.
+
+    ``titles_lower``, ``has_code`` and ``is_class`` (the title starts with
+    "Al", i.e. a class reference page) are parallel to ``docs``, and
+    ``title_to_idx`` maps each lowercased title to the positions of the docs
+    that have it, for the exact-title bonus.
+
+    ``title_postings`` maps each title word (``TITLE_TOKEN_RE``) to the sorted
+    positions of the docs whose title has it; the words are also joined with
+    newlines in ``title_vocab``, so the words containing a query term can be
+    found with one regex scan (see ``_title_term_docs``).
+
+    ``title_words`` maps each whitespace-separated word of the lowercased
+    titles to the positions of the docs whose title has it, for the "Did you
+    mean" suggestions.
+    """
+    title_to_idx: dict[str, list[int]] = {}
+    title_postings: dict[str, list[int]] = {}
+    title_words: dict[str, list[int]] = {}
+    for i, doc in enumerate(docs):
+        title_lower = doc["_title_lower"]
+        title_to_idx.setdefault(title_lower, []).append(i)
+        for token in dict.fromkeys(TITLE_TOKEN_RE.findall(title_lower)):
+            title_postings.setdefault(token, []).append(i)
+        for word in set(title_lower.split()):
+            title_words.setdefault(word, []).append(i)
+    return {
+        "titles_lower": [doc["_title_lower"] for doc in docs],
+        "has_code": np.array([bool(doc.get("has_code_blocks")) for doc in docs], dtype=bool),
+        "is_class": np.array([doc.get("title", "").startswith("Al") for doc in docs], dtype=bool),
+        "title_to_idx": title_to_idx,
+        "title_postings": {token: np.array(ids, dtype=np.int64) for token, ids in title_postings.items()},
+        "title_vocab": "\n".join(title_postings),
+        "title_words": title_words,
+    }
 
 
 # ---------------------------------------------------------------------------
 # Lifespan management — initialize docs + BM25 once at server start
 # ---------------------------------------------------------------------------
 
+def _build_docs_by_category(docs: list[dict], tables: dict) -> dict[CategoryFilter, list[dict]]:
+    """Docs sorted by title once, split per ``CategoryFilter`` for listing."""
+    titles = [doc.get("title", "") for doc in docs]
+    order = np.array(sorted(range(len(docs)), key=titles.__getitem__), dtype=np.int64)
+    is_class = tables["is_class"][order]
+    return {
+        CategoryFilter.ALL: [docs[i] for i in order.tolist()],
+        CategoryFilter.CLASS: [docs[i] for i in order[is_class].tolist()],
+        CategoryFilter.GUIDE: [docs[i] for i in order[~is_class].tolist()],
+    }
+
+
+def _build_index_json(docs_by_category: dict[CategoryFilter, list[dict]], tables: dict) -> str:
+    """Serialize the ``docs://index`` resource payload."""
+    sorted_docs = docs_by_category[CategoryFilter.ALL]
+    index = {
+        "total": len(sorted_docs),
+        "code_pages": int(tables["has_code"].sum()),
+        "pages": [
+            {
+                "title": doc.get("title"),
+                "guid": doc.get("guid"),
+                "url": doc.get("url"),
+                "has_code": doc.get("has_code_blocks", False),
+                "category": "class" if doc.get("title", "").startswith("Al") else "guide",
+            }
+            for doc in sorted_docs
+        ],
+    }
+    return orjson.dumps(index, option=orjson.OPT_INDENT_2).decode()
+
+
+def _build_stats_json(tables: dict) -> str:
+    """Serialize the ``docs://stats`` resource payload."""
+    is_class = tables["is_class"]
+    class_count = int(is_class.sum())
+    stats = {
+        "total_pages": len(is_class),
+        "class_reference_pages": class_count,
+        "guide_pages": len(is_class) - class_count,
+        "pages_with_code": int(tables["has_code"].sum()),
+    }
+    return orjson.dumps(stats, option=orjson.OPT_INDENT_2).decode()
+
+
 @asynccontextmanager
 async def server_lifespan(server: FastMCP):
     """
@@ -237,18 +546,26 @@ async def server_lifespan(server: FastMCP):
 
     Loads documentation and builds the BM25 index once at startup,
     making them available via ``ctx.request_context.lifespan_state``.
+    The corpus never changes while the server runs, so the resource
+    payloads are serialized here as well.
     """
     docs = load_documentation()
-    bm25_index, tokenized_corpus = _build_bm25_index(docs)
-    code_count = sum(1 for d in docs if d.get("has_code_blocks"))
+    bm25_index = _build_bm25_index(docs)
+    search_tables = _build_search_tables(docs)
+    docs_by_category = _build_docs_by_category(docs, search_tables)
+    code_count = int(search_tables["has_code"].sum())
 
-    print(f"Loaded {len(docs)} documentation pages ({code_count} with code blocks)")
-    print("BM25 search index built successfully.")
+    log.info("Loaded %d documentation pages (%d with code blocks)", len(docs), code_count)
+    log.info("BM25 search index built successfully.")
 
     yield {
         "docs": docs,
         "bm25_index": bm25_index,
-        "tokenized_corpus": tokenized_corpus,
+        "search_tables": search_tables,
+        "docs_by_category": docs_by_category,
+        "index_json": _build_index_json(docs_by_category, search_tables),
+        "stats_json": _build_stats_json(search_tables),
+        "search_cache": OrderedDict(),
     }
 
 
@@ -265,11 +582,21 @@ def _get_state(ctx: Context) -> dict:
 # Search helpers
 # ---------------------------------------------------------------------------
 
+# Search results kept by _cached_search
+SEARCH_CACHE_SIZE = 256
+
+# Scores are ranked after rounding to 2 decimals, which moves them by at most
+# 0.005; candidates further than this below the k-th best can't make the top k
+RANK_MARGIN = 0.02
+
+
 def search_docs(
     query: str,
     docs: list[dict],
-    bm25: BM25Okapi,
+    bm25: SparseBM25,
+    tables: dict,
     max_results: int = 5,
+    candidate_mask: Optional[np.ndarray] = None,
 ) -> list[dict]:
     """
     BM25-based search over documentation with additional heuristic boosts.
@@ -279,77 +606,193 @@ def search_docs(
       2. Exact title match bonus: +50
       3. Query term in title: +10 per term
       4. Code-block boost: 1.2x when query looks like a class/method name
+
+    Only documents with a positive BM25 score are ranked; the boosts are
+    applied to their scores as array operations (``tables`` comes from
+    ``_build_search_tables``). Result dicts are built for the top
+    ``max_results`` only. ``candidate_mask``, a bool per doc, restricts
+    the ranking to the docs where it is set.
     """
-    query_tokens = _tokenize(query)
+    query_tokens = _tokenize_query(query)
 
     if not query_tokens:
         return []
 
     # Get BM25 scores for all documents
     bm25_scores = bm25.get_scores(query_tokens)
+    return _rank_docs(query, bm25_scores, docs, tables, max_results, candidate_mask)
+
+
+def search_docs_batch(
+    queries: list[str],
+    docs: list[dict],
+    bm25: SparseBM25,
+    tables: dict,
+    max_results: int = 5,
+) -> list[list[dict]]:
+    """``search_docs`` for each of ``queries``, with the BM25 scores computed in one batch."""
+    query_tokens = [_tokenize_query(query) for query in queries]
+    bm25_scores = bm25.get_batch_scores(query_tokens)
+    return [
+        _rank_docs(query, scores, docs, tables, max_results) if tokens else []
+        for query, tokens, scores in zip(queries, query_tokens, bm25_scores)
+    ]
 
+
+def _rank_docs(
+    query: str,
+    bm25_scores: np.ndarray,
+    docs: list[dict],
+    tables: dict,
+    max_results: int,
+    candidate_mask: Optional[np.ndarray] = None,
+) -> list[dict]:
+    """The top results of ``search_docs``, given the query's BM25 scores."""
     query_lower = query.lower()
     query_terms = query_lower.split()
     code_query = bool(re.match(r"^Al[A-Z]", query)) or "::" in query
 
-    results = []
+    positive = bm25_scores > 0
+    if candidate_mask is not None:
+        positive &= candidate_mask
+    candidates = np.flatnonzero(positive)
+    scores = bm25_scores[candidates]
+    # Titles to scan for terms the title postings can't answer, if any
+    candidate_titles = None
 
-    for idx, doc in enumerate(docs):
-        bm25_score = float(bm25_scores[idx])
-        if bm25_score <= 0:
-            continue
+    # Exact title match bonus
+    exact = tables["title_to_idx"].get(query_lower)
+    if exact:
+        scores[np.isin(candidates, exact)] += 50
 
-        title = doc.get("title", "")
-        title_lower = title.lower()
-        content = doc.get("content", "")
+    for term in query_terms:
+        if TITLE_TOKEN_RE.fullmatch(term):
+            title_hits = np.isin(candidates, _title_term_docs(term, tables))
+        else:
+            if candidate_titles is None:
+                titles_lower = tables["titles_lower"]
+                candidate_titles = [titles_lower[i] for i in candidates.tolist()]
+            title_hits = np.fromiter((term in title for title in candidate_titles), dtype=bool, count=len(candidates))
+        scores[title_hits] += 10
+
+    # Code-block boost
+    if code_query:
+        scores[tables["has_code"][candidates]] *= 1.2
+
+    # Only scores close to the k-th largest can round into the top k: a
+    # score more than RANK_MARGIN below it rounds strictly lower
+    if len(scores) > max_results:
+        kth = np.partition(scores, len(scores) - max_results)[len(scores) - max_results]
+        near_top = scores >= kth - RANK_MARGIN
+        candidates = candidates[near_top]
+        scores = scores[near_top]
+
+    # Top-k on the rounded score; nlargest keeps ties in document order, as
+    # a stable descending sort would
+    rounded = [round(score, 2) for score in scores.tolist()]
+    top = heapq.nlargest(max_results, range(len(rounded)), key=rounded.__getitem__)
+    candidates = candidates.tolist()
 
-        # Combine BM25 with heuristic boosts
-        score = bm25_score
-        matched_terms = []
+    results = []
 
-        # Exact title match bonus
-        if query_lower == title_lower:
-            score += 50
+    for pos in top:
+        doc = docs[candidates[pos]]
+        title = doc.get("title", "")
+        title_lower = doc["_title_lower"]
+        content_lower = doc["_content_lower"]
 
+        matched_terms = []
         for term in query_terms:
             if term in title_lower:
-                score += 10
                 matched_terms.append(term)
-            elif term in content.lower():
+            elif term in content_lower:
                 if term not in matched_terms:
                     matched_terms.append(term)
 
-        # Code-block boost
-        if code_query and doc.get("has_code_blocks"):
-            score *= 1.2
-
-        snippet = extract_snippet(content, query_terms)
+        snippet = extract_snippet(doc.get("content", ""), query_terms, content_lower=content_lower)
         results.append({
             "guid": doc.get("guid"),
             "title": title,
             "url": doc.get("url"),
-            "score": round(score, 2),
+            "score": rounded[pos],
             "matched_terms": matched_terms,
             "has_code": doc.get("has_code_blocks", False),
             "snippet": snippet,
         })
 
-    results.sort(key=lambda x: x["score"], reverse=True)
-    return results[:max_results]
+    return results
+
 
+def _title_term_docs(term: str, tables: dict) -> np.ndarray:
+    """
+    Positions of the docs whose lowercased title contains ``term``.
+
+    ``term`` must consist of title word characters only: then it can't
+    straddle two words, so a title contains it exactly when one of the
+    title's words does.
+    """
+    title_postings = tables["title_postings"]
+    tokens = re.findall(f"[a-z0-9_:]*{re.escape(term)}[a-z0-9_:]*", tables["title_vocab"])
+    if not tokens:
+        return np.empty(0, dtype=np.int64)
+    return np.unique(np.concatenate([title_postings[token] for token in tokens]))
+
+
+def _cached_search(state: dict, query: str, max_results: int, code_only: bool = False) -> list[dict]:
+    """
+    ``search_docs`` over the lifespan's docs, memoized per ``(query, max_results, code_only)``.
 
-def extract_snippet(content: str, query_terms: list[str], snippet_length: int = 500) -> str:
-    """Extract a relevant snippet from the content containing query terms."""
-    content_lower = content.lower()
+    With ``code_only`` only the pages with code blocks are ranked.
+
+    The last ``SEARCH_CACHE_SIZE`` results are kept in ``state["search_cache"]``
+    (least recently used first); the docs never change, so they never go
+    stale. Callers must not mutate the returned results.
+    """
+    cache = state["search_cache"]
+    key = (query, max_results, code_only)
+    results = cache.get(key)
+    if results is not None:
+        cache.move_to_end(key)
+        return results
+
+    tables = state["search_tables"]
+    candidate_mask = tables["has_code"] if code_only else None
+    results = search_docs(query, state["docs"], state["bm25_index"], tables, max_results, candidate_mask)
+    cache[key] = results
+    if len(cache) > SEARCH_CACHE_SIZE:
+        cache.popitem(last=False)
+    return results
+
+
+def _cached_search_batch(state: dict, queries: list[str], max_results: int) -> list[list[dict]]:
+    """``_cached_search`` for several queries; the ones not cached are searched in one batch."""
+    cache = state["search_cache"]
+    missing = list(dict.fromkeys(q for q in queries if (q, max_results, False) not in cache))
+    if missing:
+        batch = search_docs_batch(missing, state["docs"], state["bm25_index"], state["search_tables"], max_results)
+        for query, results in zip(missing, batch):
+            cache[(query, max_results, False)] = results
+            if len(cache) > SEARCH_CACHE_SIZE:
+                cache.popitem(last=False)
+    return [_cached_search(state, query, max_results) for query in queries]
+
+
+def extract_snippet(
+    content: str, query_terms: list[str], snippet_length: int = 500, content_lower: str | None = None
+) -> str:
+    """
+    Extract a relevant snippet from the content containing query terms.
+
+    ``content_lower`` is the precomputed lowercased content, if the caller has it.
+    """
+    if content_lower is None:
+        content_lower = content.lower()
 
     # Find the first occurrence of any query term
-    best_pos = len(content)
-    for term in query_terms:
-        pos = content_lower.find(term)
-        if pos != -1 and pos < best_pos:
-            best_pos = pos
+    positions = [pos for pos in map(content_lower.find, query_terms) if pos != -1]
+    best_pos = min(positions, default=len(content))
 
-    if best_pos == len(content):
+    if best_pos >= len(content):
         # No positional match — return the beginning
         return content[:snippet_length] + ("..." if len(content) > snippet_length else "")
 
@@ -373,15 +816,17 @@ def extract_snippet(content: str, query_terms: list[str], snippet_length: int =
 
 def _format_search_results_md(results: list[dict], query: str) -> str:
     """Format search results as Markdown."""
-    output = f"Found {len(results)} results for: {query}\n\n"
+    parts = [f"Found {len(results)} results for: {query}\n\n"]
     for i, result in enumerate(results, 1):
         code_tag = " 📝" if result["has_code"] else ""
-        output += f"## {i}. {result['title']}{code_tag}\n"
-        output += f"**URL:** {result['url']}\n"
-        output += f"**Matched terms:** {', '.join(result['matched_terms'])}\n"
-        output += f"\n{result['snippet']}\n\n"
-        output += "---\n\n"
-    return output
+        parts.append(
+            f"## {i}. {result['title']}{code_tag}\n"
+            f"**URL:** {result['url']}\n"
+            f"**Matched terms:** {', '.join(result['matched_terms'])}\n"
+            f"\n{result['snippet']}\n\n"
+            "---\n\n"
+        )
+    return "".join(parts)
 
 
 def _format_search_results_json(results: list[dict], query: str) -> str:
@@ -394,6 +839,34 @@ def _format_search_results_json(results: list[dict], query: str) -> str:
     return json.dumps(payload, indent=2, ensure_ascii=False)
 
 
+def _format_batch_results_md(batch: list[list[dict]], queries: list[str]) -> str:
+    """Format the results of several searches as Markdown, one section per query."""
+    parts = [f"Searched {len(queries)} queries\n\n"]
+    for i, (results, query) in enumerate(zip(batch, queries), 1):
+        parts.append(f"# Query {i}: {query}\n\n")
+        if results:
+            parts.append(_format_search_results_md(results, query))
+        else:
+            parts.append(f"No results found for: '{query}'.\n\n")
+    return "".join(parts)
+
+
+def _format_batch_results_json(batch: list[list[dict]], queries: list[str]) -> str:
+    """Format the results of several searches as JSON."""
+    payload = {
+        "total_queries": len(queries),
+        "searches": [
+            {
+                "query": query,
+                "total_results": len(results),
+                "results": results,
+            }
+            for results, query in zip(batch, queries)
+        ],
+    }
+    return json.dumps(payload, indent=2, ensure_ascii=False)
+
+
 def _format_list_md(
     page: list[dict],
     total: int,
@@ -403,22 +876,22 @@ def _format_list_md(
     category_label: str,
 ) -> str:
     """Format paginated list as Markdown."""
-    output = f"## {category_label} ({total} total)\n"
-    output += f"Showing {offset + 1}–{offset + len(page)} of {total}\n\n"
+    parts = [
+        f"## {category_label} ({total} total)\n",
+        f"Showing {offset + 1}–{offset + len(page)} of {total}\n\n",
+    ]
 
-    for doc in page:
-        code_tag = " 📝" if doc.get("has_code_blocks") else ""
-        output += f"- **{doc.get('title')}**{code_tag}\n"
+    parts.extend(f"- **{doc.get('title')}**{' 📝' if doc.get('has_code_blocks') else ''}\n" for doc in page)
 
-    output += "\n---\n"
-    output += f"**Total:** {total} | **Showing:** {len(page)} | **Offset:** {offset}\n"
+    parts.append("\n---\n")
+    parts.append(f"**Total:** {total} | **Showing:** {len(page)} | **Offset:** {offset}\n")
 
     if has_more:
-        output += f"**Has more:** Yes | **Next offset:** {next_offset}\n"
+        parts.append(f"**Has more:** Yes | **Next offset:** {next_offset}\n")
     else:
-        output += "**Has more:** No\n"
+        parts.append("**Has more:** No\n")
 
-    return output
+    return "".join(parts)
 
 
 def _format_list_json(
@@ -478,18 +951,18 @@ async def search_alias_docs(params: SearchInput, ctx: Context = None) -> str:
     """
     state = _get_state(ctx)
     docs = state["docs"]
-    bm25 = state["bm25_index"]
 
     await ctx.info(f"Searching for '{params.query}' (max_results={params.max_results}, format={params.response_format.value})")
 
     if not docs:
         return (
             "No documentation available. "
-            "The data/docs_tavily/ directory is empty or missing. "
-            "Run the Tavily scraper first to populate documentation."
+            "The data/docs_tavily/clean/ directory is empty or missing. "
+            "Run the Tavily scraper first to populate documentation, "
+            f"or `{MIGRATE_COMMAND}` to move pages saved by an older scraper version."
         )
 
-    results = search_docs(params.query, docs, bm25, params.max_results)
+    results = _cached_search(state, params.query, params.max_results)
 
     if not results:
         await ctx.debug(f"No results found for '{params.query}'")
@@ -509,6 +982,54 @@ async def search_alias_docs(params: SearchInput, ctx: Context = None) -> str:
     return _format_search_results_md(results, params.query)
 
 
+@mcp.tool(
+    name="search_alias_docs_batch",
+    annotations={
+        "title": "Search Alias Documentation (Batch)",
+        "readOnlyHint": True,
+        "destructiveHint": False,
+        "idempotentHint": True,
+        "openWorldHint": False,
+    },
+)
+async def search_alias_docs_batch(params: SearchBatchInput, ctx: Context = None) -> str:
+    """
+    Run several searches of the Autodesk Alias Python API documentation at once.
+
+    Cheaper than calling search_alias_docs once per query when comparing
+    alternative phrasings: the BM25 scores are computed in a single batch.
+
+    Args:
+        params (SearchBatchInput): Validated input parameters containing:
+            - queries (list[str]): Search strings (1–20), each like a search_alias_docs query
+            - max_results (int): Maximum results to return per query (1–20, default 5)
+            - response_format (str): 'markdown' or 'json' (default 'markdown')
+
+    Returns:
+        str: Search results for every query, in the requested format.
+    """
+    state = _get_state(ctx)
+    docs = state["docs"]
+
+    await ctx.info(f"Searching {len(params.queries)} queries (max_results={params.max_results}, format={params.response_format.value})")
+
+    if not docs:
+        return (
+            "No documentation available. "
+            "The data/docs_tavily/clean/ directory is empty or missing. "
+            "Run the Tavily scraper first to populate documentation, "
+            f"or `{MIGRATE_COMMAND}` to move pages saved by an older scraper version."
+        )
+
+    batch = _cached_search_batch(state, params.queries, params.max_results)
+
+    await ctx.debug(f"Found {sum(map(len, batch))} results for {len(params.queries)} queries")
+
+    if params.response_format == ResponseFormat.JSON:
+        return _format_batch_results_json(batch, params.queries)
+    return _format_batch_results_md(batch, params.queries)
+
+
 @mcp.tool(
     name="list_available_docs",
     annotations={
@@ -541,20 +1062,13 @@ async def list_available_docs(params: ListDocsInput, ctx: Context = None) -> str
     if not docs:
         return (
             "No documentation available. "
-            "The data/docs_tavily/ directory is empty or missing. "
-            "Run the Tavily scraper first to populate documentation."
+            "The data/docs_tavily/clean/ directory is empty or missing. "
+            "Run the Tavily scraper first to populate documentation, "
+            f"or `{MIGRATE_COMMAND}` to move pages saved by an older scraper version."
         )
 
-    # Apply category filter
-    if params.category == CategoryFilter.CLASS:
-        filtered = [d for d in docs if d.get("title", "").startswith("Al")]
-    elif params.category == CategoryFilter.GUIDE:
-        filtered = [d for d in docs if not d.get("title", "").startswith("Al")]
-    else:
-        filtered = docs
-
-    # Sort alphabetically by title
-    filtered = sorted(filtered, key=lambda x: x.get("title", ""))
+    # Category filter, already sorted alphabetically by title
+    filtered = state["docs_by_category"][params.category]
     total = len(filtered)
 
     # Apply pagination
@@ -607,36 +1121,38 @@ async def get_doc_by_title(params: GetDocInput, ctx: Context = None) -> str:
     """
     state = _get_state(ctx)
     docs = state["docs"]
+    tables = state["search_tables"]
     title_lower = params.title.lower()
 
     await ctx.info(f"Looking up doc page: '{params.title}'")
 
     # Try exact match first, then partial
-    for doc in docs:
-        if title_lower == doc.get("title", "").lower():
-            await ctx.debug(f"Exact match found: '{doc.get('title')}'")
-            return _format_doc(doc)
-
-    for doc in docs:
-        if title_lower in doc.get("title", "").lower():
-            await ctx.debug(f"Partial match found: '{doc.get('title')}'")
-            return _format_doc(doc)
+    exact = tables["title_to_idx"].get(title_lower)
+    if exact:
+        doc = docs[exact[0]]
+        await ctx.debug(f"Exact match found: '{doc.get('title')}'")
+        return _format_doc(doc)
+
+    i = _find_title_containing(title_lower, tables)
+    if i is not None:
+        doc = docs[i]
+        await ctx.debug(f"Partial match found: '{doc.get('title')}'")
+        return _format_doc(doc)
 
     # Build a helpful error with suggestions
     await ctx.debug(f"No match found for '{params.title}', generating suggestions")
-    suggestions = _find_similar_titles(title_lower, docs, max_suggestions=3)
-    msg = f"No documentation found matching: '{params.title}'."
+    suggestions = _find_similar_titles(title_lower, docs, state["search_tables"], max_suggestions=3)
+    parts = [f"No documentation found matching: '{params.title}'."]
     if suggestions:
-        msg += "\n\n**Did you mean:**\n"
-        for s in suggestions:
-            msg += f"- {s}\n"
-    msg += (
+        parts.append("\n\n**Did you mean:**\n")
+        parts.extend(f"- {s}\n" for s in suggestions)
+    parts.append(
         "\n**Recovery options:**\n"
         "- Use `list_available_docs` to browse all pages\n"
         "- Use `search_alias_docs` to search by keyword\n"
         "- Try a shorter or more general title fragment"
     )
-    return msg
+    return "".join(parts)
 
 
 @mcp.tool(
@@ -667,32 +1183,30 @@ async def get_code_examples(params: CodeExamplesInput, ctx: Context = None) -> s
     """
     state = _get_state(ctx)
     docs = state["docs"]
-    bm25 = state["bm25_index"]
 
     await ctx.info(f"Searching code examples for '{params.topic}' (max_results={params.max_results})")
 
     if not docs:
         return (
             "No documentation available. "
-            "The data/docs_tavily/ directory is empty or missing. "
-            "Run the Tavily scraper first to populate documentation."
+            "The data/docs_tavily/clean/ directory is empty or missing. "
+            "Run the Tavily scraper first to populate documentation, "
+            f"or `{MIGRATE_COMMAND}` to move pages saved by an older scraper version."
         )
 
-    # Filter to only docs with code blocks
-    code_docs = [d for d in docs if d.get("has_code_blocks")]
+    code_count = int(state["search_tables"]["has_code"].sum())
 
-    if not code_docs:
+    if not code_count:
         return "No documentation pages with code examples found in the current dataset."
 
-    # Search within the full corpus but filter results to code-only
-    all_results = search_docs(params.topic, docs, bm25, max_results=50)
-    code_results = [r for r in all_results if r["has_code"]][:params.max_results]
+    # Rank only the pages with code blocks
+    code_results = _cached_search(state, params.topic, params.max_results, code_only=True)
 
     if not code_results:
-        await ctx.debug(f"No code results for '{params.topic}' (total code pages: {len(code_docs)})")
+        await ctx.debug(f"No code results for '{params.topic}' (total code pages: {code_count})")
         return (
             f"No code examples found for: '{params.topic}'.\n\n"
-            f"**Info:** There are {len(code_docs)} pages with code blocks in the dataset.\n\n"
+            f"**Info:** There are {code_count} pages with code blocks in the dataset.\n\n"
             f"**Suggestions:**\n"
             f"- Try broader terms (e.g. 'plug-in' instead of 'momentary plug-in example')\n"
             f"- Use `search_alias_docs` to find related pages first\n"
@@ -704,14 +1218,16 @@ async def get_code_examples(params: CodeExamplesInput, ctx: Context = None) -> s
     if params.response_format == ResponseFormat.JSON:
         return _format_search_results_json(code_results, params.topic)
 
-    output = f"Found {len(code_results)} pages with code examples for: {params.topic}\n\n"
+    parts = [f"Found {len(code_results)} pages with code examples for: {params.topic}\n\n"]
     for i, result in enumerate(code_results, 1):
-        output += f"## {i}. {result['title']} 📝\n"
-        output += f"**URL:** {result['url']}\n"
-        output += f"**Matched terms:** {', '.join(result['matched_terms'])}\n"
-        output += f"\n{result['snippet']}\n\n"
-        output += "---\n\n"
-    return output
+        parts.append(
+            f"## {i}. {result['title']} 📝\n"
+            f"**URL:** {result['url']}\n"
+            f"**Matched terms:** {', '.join(result['matched_terms'])}\n"
+            f"\n{result['snippet']}\n\n"
+            "---\n\n"
+        )
+    return "".join(parts)
 
 
 # ---------------------------------------------------------------------------
@@ -720,29 +1236,63 @@ async def get_code_examples(params: CodeExamplesInput, ctx: Context = None) -> s
 
 def _format_doc(doc: dict) -> str:
     """Format a document for output."""
-    output = f"# {doc.get('title')}\n\n"
-    output += f"**URL:** {doc.get('url')}\n"
+    parts = [f"# {doc.get('title')}\n\n", f"**URL:** {doc.get('url')}\n"]
     if doc.get("has_code_blocks"):
-        output += "**Contains code examples:** Yes\n"
-    output += "\n"
-    output += doc.get("content", "No content available.")
-    return output
+        parts.append("**Contains code examples:** Yes\n")
+    parts.append("\n")
+    parts.append(doc.get("content", "No content available."))
+    return "".join(parts)
 
 
-def _find_similar_titles(query: str, docs: list[dict], max_suggestions: int = 3) -> list[str]:
-    """Find titles that partially overlap with the query for error suggestions."""
-    query_terms = set(query.lower().split())
-    scored = []
+def _find_title_containing(title_lower: str, tables: dict) -> int | None:
+    """
+    Position of the first doc whose lowercased title contains ``title_lower``.
 
-    for doc in docs:
-        title = doc.get("title", "")
-        title_terms = set(title.lower().split())
-        overlap = len(query_terms & title_terms)
-        if overlap > 0:
-            scored.append((overlap, title))
+    Each run of title word characters in ``title_lower`` has to occur within
+    one word of a matching title, so only the docs that have such a word for
+    every run are checked (see ``_title_term_docs``).
+    """
+    titles_lower = tables["titles_lower"]
+    pieces = TITLE_TOKEN_RE.findall(title_lower)
+    if pieces:
+        candidates = functools.reduce(np.intersect1d, (_title_term_docs(piece, tables) for piece in pieces)).tolist()
+    else:
+        candidates = range(len(titles_lower))
 
-    scored.sort(key=lambda x: x[0], reverse=True)
-    return [title for _, title in scored[:max_suggestions]]
+    for i in candidates:
+        if title_lower in titles_lower[i]:
+            return i
+    return None
+
+
+def _find_similar_titles(query: str, docs: list[dict], tables: dict, max_suggestions: int = 3) -> list[str]:
+    """
+    Find titles that partially overlap with the query for error suggestions.
+
+    Titles are ranked by how many of the query's words they share (looked up
+    in ``tables["title_words"]``), ties in document order. A misspelled query
+    ("alcruve") shares no word with the title it was meant to be, so any
+    remaining slots are filled with the closest spellings by ``difflib``.
+    """
+    query_lower = query.lower()
+    title_words = tables["title_words"]
+    overlap = Counter()
+    for term in set(query_lower.split()):
+        overlap.update(title_words.get(term, ()))
+
+    best = heapq.nsmallest(max_suggestions, overlap.items(), key=lambda item: (-item[1], item[0]))
+    suggested = [i for i, _ in best]
+
+    if len(suggested) < max_suggestions:
+        title_to_idx = tables["title_to_idx"]
+        for title in difflib.get_close_matches(query_lower, title_to_idx, n=max_suggestions):
+            i = title_to_idx[title][0]
+            if i not in suggested:
+                suggested.append(i)
+                if len(suggested) == max_suggestions:
+                    break
+
+    return [docs[i].get("title", "") for i in suggested]
 
 
 # ---------------------------------------------------------------------------
@@ -759,24 +1309,7 @@ async def docs_index(ctx: Context = None) -> str:
     More efficient than list_available_docs for programmatic access to
     the full index without pagination overhead.
     """
-    state = _get_state(ctx)
-    docs = state["docs"]
-
-    index = {
-        "total": len(docs),
-        "code_pages": sum(1 for d in docs if d.get("has_code_blocks")),
-        "pages": [
-            {
-                "title": doc.get("title"),
-                "guid": doc.get("guid"),
-                "url": doc.get("url"),
-                "has_code": doc.get("has_code_blocks", False),
-                "category": "class" if doc.get("title", "").startswith("Al") else "guide",
-            }
-            for doc in sorted(docs, key=lambda x: x.get("title", ""))
-        ],
-    }
-    return json.dumps(index, indent=2, ensure_ascii=False)
+    return _get_state(ctx)["index_json"]
 
 
 @mcp.resource("docs://stats")
@@ -787,20 +1320,7 @@ async def docs_stats(ctx: Context = None) -> str:
     Returns a quick summary of the documentation corpus: total pages,
     class reference count, guide count, and pages with code examples.
     """
-    state = _get_state(ctx)
-    docs = state["docs"]
-
-    class_count = sum(1 for d in docs if d.get("title", "").startswith("Al"))
-    guide_count = len(docs) - class_count
-    code_count = sum(1 for d in docs if d.get("has_code_blocks"))
-
-    stats = {
-        "total_pages": len(docs),
-        "class_reference_pages": class_count,
-        "guide_pages": guide_count,
-        "pages_with_code": code_count,
-    }
-    return json.dumps(stats, indent=2, ensure_ascii=False)
+    return _get_state(ctx)["stats_json"]
 
 
 # ---------------------------------------------------------------------------
@@ -809,8 +1329,8 @@ async def docs_stats(ctx: Context = None) -> str:
 
 def run_server():
     """Run the MCP server."""
-    print("Starting Autodesk Alias Documentation MCP Server (V3)...")
-    print(f"Documentation directory: {DOCS_DIR}")
+    log.info("Starting Autodesk Alias Documentation MCP Server (V3)...")
+    log.info("Documentation directory: %s", DOCS_DIR)
     mcp.run()
 
 